@@ -18,14 +18,23 @@ import logging
 import asyncio
 import json
 import time
+import threading
 import aiohttp
-from typing import Dict, List, Any, Optional, Callable
+import numpy as np
+import psutil
+from typing import Dict, List, Any, Optional, Callable, Mapping
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
+import heapq
+import operator
 import os
+import re
+import shlex
+from collections import deque, defaultdict, OrderedDict
 from contextlib import asynccontextmanager
+from types import MappingProxyType
 
 # GitHub integration
 import requests
@@ -36,6 +45,84 @@ import hashlib
 import hmac
 import base64
 
+from src.utils.dataclass_slots import add_slots
+
+# Async file I/O (falls back to worker threads when unavailable)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Fast JSON codec (falls back to the standard library when unavailable)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# SIMD-accelerated hashing for task fingerprints (falls back to SHA-256)
+try:
+    from blake3 import blake3 as _fingerprint_hasher
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    _fingerprint_hasher = hashlib.sha256
+    BLAKE3_AVAILABLE = False
+
+# Fingerprints name their hash, so journal entries written under another one never match
+_FINGERPRINT_PREFIX = 'blake3:' if BLAKE3_AVAILABLE else 'sha256:'
+
+# Compact binary encoding for the crash-recovery journal
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# libuv-based event loop (falls back to the default asyncio loop)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created after this call
+    
+    Call before asyncio.run() in the process hosting the engine.
+    
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+def _json_loads(data):
+    """Parse JSON from str or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(data) -> str:
+    """Serialize data to a compact JSON string"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str).decode('utf-8')
+    return json.dumps(data, default=str)
+
+def _json_dumps_pretty(data) -> str:
+    """Serialize data to an indented JSON string"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        except TypeError:
+            pass  # Let json report or handle what orjson rejects (e.g. big ints)
+    return json.dumps(data, indent=2)
+
 class ExecutionStatus(Enum):
     """Status of execution tasks"""
     PENDING = "pending"
@@ -52,6 +139,43 @@ class ExecutionPriority(Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+# Characters that need a shell to interpret a command string
+SHELL_METACHARACTERS = re.compile(r'[|&;<>()$`\\*?\[\]{}~!#\n]')
+
+# Shell builtins and keywords that have no executable of their own to exec
+SHELL_BUILTINS = frozenset({
+    '.', ':', 'alias', 'bg', 'break', 'builtin', 'case', 'cd', 'command',
+    'continue', 'declare', 'eval', 'exec', 'exit', 'export', 'fc', 'fg',
+    'for', 'function', 'getopts', 'hash', 'if', 'jobs', 'let', 'local',
+    'readonly', 'return', 'select', 'set', 'shift', 'source', 'time',
+    'times', 'trap', 'type', 'typeset', 'ulimit', 'umask', 'unalias',
+    'unset', 'until', 'wait', 'while'
+})
+
+# Per-line buffer limit for subprocess pipes (asyncio defaults to 64 KiB)
+SUBPROCESS_STREAM_LIMIT = 1 << 20
+
+# Read size for streamed subprocess output
+SUBPROCESS_READ_CHUNK = 1 << 16
+
+# Scheduling order for priorities (lower runs first)
+PRIORITY_RANK = {
+    ExecutionPriority.CRITICAL: 0,
+    ExecutionPriority.HIGH: 1,
+    ExecutionPriority.MEDIUM: 2,
+    ExecutionPriority.LOW: 3
+}
+
+# Comparison operators accepted by monitoring tasks
+MONITORING_COMPARISONS = {
+    'equals': operator.eq,
+    'greater_than': operator.gt,
+    'less_than': operator.lt,
+    'greater_equal': operator.ge,
+    'less_equal': operator.le
+}
+
+@add_slots
 @dataclass
 class ExecutionTask:
     """Represents an execution task"""
@@ -71,6 +195,7 @@ class ExecutionTask:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
+@add_slots
 @dataclass
 class ExecutionWorkflow:
     """Represents a multi-step execution workflow"""
@@ -84,6 +209,26 @@ class ExecutionWorkflow:
     current_task_index: int = 0
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    task_by_id: Dict[str, ExecutionTask] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index tasks by id once, at construction"""
+        self.task_by_id = {task.task_id: task for task in self.tasks}
+
+@add_slots
+@dataclass
+class ResourcePool:
+    """Capacity counters for one resource type, guarded by their own condition"""
+    available: int
+    allocated: int = 0
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+
+    @property
+    def free(self) -> int:
+        return self.available - self.allocated
+
+    def to_dict(self) -> Dict[str, int]:
+        return {'available': self.available, 'allocated': self.allocated}
 
 class AutonomousExecutionEngine:
     """
@@ -105,20 +250,60 @@ class AutonomousExecutionEngine:
         # Execution state
         self.active_workflows = {}
         self.active_tasks = {}
-        self.completed_workflows = []
-        self.execution_history = []
+        self._workflow_active_tasks = defaultdict(set)
+        self._workflow_handles = {}
+        
+        # Task deadlines as a min-heap of (deadline, task_id)
+        self._timeout_heap = []
+        self._timeout_event = asyncio.Event()
+        self._expired_tasks = {}  # task_id -> task stopped by the timeout watchdog
+        self._timeout_watchdog_task = None
+        history_size = config.get('history_size', 1024)
+        self.completed_workflows = deque(maxlen=history_size)
+        self.execution_history = deque(maxlen=history_size)
+        
+        # Records of workflows evicted from history, awaiting flush to the history file
+        self.history_file = config.get('history_file')
+        self.history_flush_interval = config.get('history_flush_interval', 60)
+        self._pending_history = deque()
+        self.max_parallel_tasks = config.get('max_parallel_tasks', 10)
+        
+        # Dependency levels memoized by workflow shape
+        self._level_cache = OrderedDict()
+        self.level_cache_size = config.get('level_cache_size', 128)
+        
+        # Result cache for idempotent tasks, keyed by task fingerprint
+        self._result_cache = {}
+        self.result_cache_ttl = config.get('result_cache_ttl', 300)
+        
+        # Crash-recovery journal of tasks completed inside active workflows
+        self.journal_file = config.get('journal_file')
+        self._journal = None
+        self._task_workflows = {}
+        self._recovered_results = {}  # workflow_id -> {task_id: journal entry}
+        self._journal_entries = defaultdict(list)  # workflow_id -> packed entries still needed
+        self._journal_lock = asyncio.Lock()
+        self.journal_recovery_ttl = config.get('journal_recovery_ttl', 86400)
+        self.journal_compact_bytes = config.get('journal_compact_bytes', 1 << 20)
+        
+        # Tasks already rolled back in active workflows
+        self._rollback_cache = set()
         
         # Resource management
         self.resource_pools = {
-            'cpu': {'available': 100, 'allocated': 0},
-            'memory': {'available': 100, 'allocated': 0},
-            'network': {'available': 100, 'allocated': 0},
-            'storage': {'available': 100, 'allocated': 0}
+            'cpu': ResourcePool(available=100),
+            'memory': ResourcePool(available=100),
+            'network': ResourcePool(available=100),
+            'storage': ResourcePool(available=100)
         }
+        self._resource_allocations = {}
+        self.resource_wait_timeout = config.get('resource_wait_timeout', 30)
         
         # External service connections
         self.github_client = None
         self.http_session = None
+        self._repo_cache = {}
+        self.repo_cache_ttl = config.get('repo_cache_ttl', 300)
         
         # Security and authentication
         self.api_keys = {}
@@ -130,7 +315,43 @@ class AutonomousExecutionEngine:
             'successful_executions': 0,
             'failed_executions': 0,
             'average_execution_time': 0.0,
-            'resource_utilization': {}
+            'execution_time_stddev': 0.0,
+            'resource_utilization': {},
+            'process_utilization': {},
+            'task_runtime_estimates': {}
+        }
+        
+        # Smoothing factor for the per-task-type runtime moving average
+        self.runtime_ema_alpha = config.get('runtime_ema_alpha', 0.2)
+        
+        # Process sampling runs on its own thread so event-loop stalls don't skew it
+        self.process_sample_interval = config.get('process_sample_interval', 30)
+        self._metrics_lock = threading.Lock()
+        self._monitor_stop = threading.Event()
+        self._monitor_thread = None
+        self._execution_time_m2 = 0.0
+        self._workflow_time_m2 = 0.0
+        self._metrics_snapshot = {}
+        self._metrics_view = MappingProxyType(self._metrics_snapshot)
+        
+        # Serialized status, refreshed by the monitoring loop and at workflow boundaries
+        self._status_snapshot = None
+        
+        # Task handler dispatch tables
+        self._task_dispatch = {
+            'github_operation': self._execute_github_task,
+            'api_call': self._execute_api_call_task,
+            'file_operation': self._execute_file_operation_task,
+            'data_processing': self._execute_data_processing_task,
+            'monitoring': self._execute_monitoring_task,
+            'notification': self._execute_notification_task,
+            'system_command': self._execute_system_command_task
+        }
+        self._github_dispatch = {
+            'create_branch': self._github_create_branch,
+            'commit_files': self._github_commit_files,
+            'update_file': self._github_update_file,
+            'create_pull_request': self._github_create_pull_request
         }
         
         # Initialize components
@@ -138,6 +359,16 @@ class AutonomousExecutionEngine:
         
         self.logger.info("Autonomous Execution Engine initialized")
 
+    @property
+    def metrics(self) -> Mapping[str, Any]:
+        """Read-only view of the execution metrics, nested dicts included"""
+        with self._metrics_lock:
+            for key, value in self.execution_metrics.items():
+                self._metrics_snapshot[key] = (
+                    MappingProxyType(value) if isinstance(value, dict) else value
+                )
+        return self._metrics_view
+
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the execution engine"""
         logger = logging.getLogger(f"{__name__}.AutonomousExecutionEngine")
@@ -170,8 +401,19 @@ class AutonomousExecutionEngine:
             # Load API keys and tokens
             await self._load_credentials()
             
+            # Recover results of tasks finished before an unclean shutdown
+            if self.journal_file:
+                await asyncio.to_thread(self._load_journal)
+            
             # Start background monitoring
             asyncio.create_task(self._monitoring_loop())
+            self._timeout_watchdog_task = asyncio.create_task(self._timeout_watchdog_loop())
+            self._monitor_thread = threading.Thread(
+                target=self._process_monitor_thread, daemon=True
+            )
+            self._monitor_thread.start()
+            if self.history_file:
+                asyncio.create_task(self._flush_history_loop())
             
             self.logger.info("Execution engine components initialized")
             
@@ -213,6 +455,8 @@ class AutonomousExecutionEngine:
             workflow.start_time = time.time()
             
             self.active_workflows[workflow.workflow_id] = workflow
+            for task in workflow.tasks:
+                self._task_workflows[task.task_id] = workflow.workflow_id
             
             if workflow.parallel_execution:
                 result = await self._execute_parallel_workflow(workflow)
@@ -222,13 +466,18 @@ class AutonomousExecutionEngine:
             workflow.end_time = time.time()
             workflow.status = ExecutionStatus.COMPLETED if result['success'] else ExecutionStatus.FAILED
             
-            # Move to completed workflows
-            self.completed_workflows.append(workflow)
-            del self.active_workflows[workflow.workflow_id]
+            # Move to completed workflows (cancel_workflow may already have)
+            if self.active_workflows.pop(workflow.workflow_id, None) is not None:
+                self._record_completed_workflow(workflow)
             
             # Update metrics
             self._update_execution_metrics(workflow, result)
             
+            # Drop stale cached results at the workflow boundary
+            self._evict_result_cache()
+            self._refresh_status_snapshot()
+            await self._finish_workflow_journal(workflow)
+            
             self.logger.info(
                 f"Workflow {workflow.workflow_id} completed: "
                 f"{'SUCCESS' if result['success'] else 'FAILED'}"
@@ -244,6 +493,8 @@ class AutonomousExecutionEngine:
             if workflow.rollback_on_failure:
                 await self._rollback_workflow(workflow)
             
+            await self._finish_workflow_journal(workflow)
+            
             return {
                 'success': False,
                 'error': str(e),
@@ -254,21 +505,47 @@ class AutonomousExecutionEngine:
         """Execute workflow tasks sequentially"""
         try:
             results = []
+            succeeded_task_ids = set()
             
             for i, task in enumerate(workflow.tasks):
                 workflow.current_task_index = i
                 
+                if workflow.workflow_id not in self.active_workflows:
+                    return {
+                        'success': False,
+                        'error': 'Workflow cancelled',
+                        'completed_tasks': results
+                    }
+                
                 # Check dependencies
-                if not await self._check_task_dependencies(task, results):
+                if not self._check_task_dependencies(task, succeeded_task_ids):
                     return {
                         'success': False,
                         'error': f"Task {task.task_id} dependencies not met",
                         'completed_tasks': results
                     }
                 
-                # Execute task
-                task_result = await self.execute_task(task)
+                # Execute task behind a handle cancel_workflow can cancel
+                task_handle = asyncio.ensure_future(self.execute_task(task))
+                self._workflow_handles[workflow.workflow_id] = {task_handle: task}
+                try:
+                    task_result = await task_handle
+                except asyncio.CancelledError:
+                    if workflow.workflow_id in self.active_workflows:
+                        raise
+                    results.append({
+                        'success': False,
+                        'error': 'Task cancelled',
+                        'task_id': task.task_id
+                    })
+                    return {
+                        'success': False,
+                        'error': 'Workflow cancelled',
+                        'completed_tasks': results
+                    }
                 results.append(task_result)
+                if task_result['success']:
+                    succeeded_task_ids.add(task.task_id)
                 
                 # Check if task failed and rollback is enabled
                 if not task_result['success'] and workflow.rollback_on_failure:
@@ -296,42 +573,163 @@ class AutonomousExecutionEngine:
                 'error': str(e),
                 'completed_tasks': results if 'results' in locals() else []
             }
+        
+        finally:
+            self._workflow_handles.pop(workflow.workflow_id, None)
 
     async def _execute_parallel_workflow(self, workflow: ExecutionWorkflow) -> Dict[str, Any]:
         """Execute workflow tasks in parallel where possible"""
+        merged_tasks = {}
         try:
-            # Group tasks by dependency levels
+            # Dependency levels are used to favour tasks deeper in the graph
             task_levels = self._analyze_task_dependencies(workflow.tasks)
-            results = []
+            task_depths = {
+                task.task_id: level
+                for level, tasks in task_levels.items()
+                for task in tasks
+            }
             
-            for level, tasks in task_levels.items():
-                self.logger.info(f"Executing level {level} with {len(tasks)} tasks")
-                
-                # Execute all tasks in this level in parallel
-                level_tasks = [self.execute_task(task) for task in tasks]
-                level_results = await asyncio.gather(*level_tasks, return_exceptions=True)
+            # Fold sibling file updates on the same branch into single commits
+            scheduled_tasks, merged_tasks = self._coalesce_file_updates(workflow.tasks)
+            task_aliases = {}
+            for merged_id, members in merged_tasks.items():
+                self._task_workflows[merged_id] = workflow.workflow_id
+                task_depths[merged_id] = task_depths.get(members[0].task_id, 0)
+                for member in members:
+                    task_aliases[member.task_id] = merged_id
+            
+            tasks_by_id = {task.task_id: task for task in scheduled_tasks}
+            pending_dependencies = {}
+            dependents = defaultdict(list)
+            for task in scheduled_tasks:
+                dependencies = {
+                    task_aliases.get(dep, dep) for dep in task.dependencies
+                    if task_aliases.get(dep, dep) in tasks_by_id
+                }
+                pending_dependencies[task.task_id] = dependencies
+                for dependency_id in dependencies:
+                    dependents[dependency_id].append(task.task_id)
+            
+            ready = []
+            submission_order = {task.task_id: i for i, task in enumerate(scheduled_tasks)}
+            runtime_estimates = self.execution_metrics['task_runtime_estimates']
+            
+            # Within a priority, favour deep tasks, then those expected to run longest
+            def mark_ready(task: ExecutionTask):
+                heapq.heappush(ready, (
+                    PRIORITY_RANK.get(task.priority, len(PRIORITY_RANK)),
+                    -task_depths.get(task.task_id, 0),
+                    -runtime_estimates.get(task.task_type, 0.0),
+                    submission_order[task.task_id],
+                    task.task_id
+                ))
+            
+            for task in scheduled_tasks:
+                if not pending_dependencies[task.task_id]:
+                    mark_ready(task)
+            
+            results = []
+            running = {}
+            self._workflow_handles[workflow.workflow_id] = running
+            finished = deque()
+            succeeded_task_ids = set()
+            failed_result = None
+            
+            while ready or running or finished:
+                cancelled = workflow.workflow_id not in self.active_workflows
                 
-                # Process results
-                for i, result in enumerate(level_results):
-                    if isinstance(result, Exception):
-                        task_result = {
+                # Start ready tasks up to the concurrency limit
+                while (ready and len(running) < self.max_parallel_tasks
+                       and not failed_result and not cancelled):
+                    task = tasks_by_id[heapq.heappop(ready)[-1]]
+                    
+                    # Skip tasks whose dependencies did not succeed in this workflow,
+                    # by the same rule as the sequential executor
+                    if not self._check_task_dependencies(task, succeeded_task_ids):
+                        task.status = ExecutionStatus.FAILED
+                        task.error = 'Dependencies not met'
+                        finished.append((task, {
                             'success': False,
-                            'error': str(result),
-                            'task_id': tasks[i].task_id
-                        }
-                    else:
-                        task_result = result
+                            'error': f"Task {task.task_id} dependencies not met",
+                            'task_id': task.task_id
+                        }))
+                        continue
+                    
+                    running[asyncio.ensure_future(self.execute_task(task))] = task
+                
+                if not running and not finished:
+                    break
+                
+                if not finished:
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        task = running.pop(future)
+                        try:
+                            task_result = future.result()
+                        except asyncio.CancelledError:
+                            task_result = {
+                                'success': False,
+                                'error': 'Task cancelled',
+                                'task_id': task.task_id
+                            }
+                        except Exception as e:
+                            task_result = {
+                                'success': False,
+                                'error': str(e),
+                                'task_id': task.task_id
+                            }
+                        finished.append((task, task_result))
+                
+                while finished:
+                    task, task_result = finished.popleft()
                     
-                    results.append(task_result)
+                    if task.task_id in merged_tasks:
+                        results.extend(self._expand_merged_result(
+                            merged_tasks[task.task_id], task, task_result
+                        ))
+                    else:
+                        results.append(task_result)
                     
-                    # Check for failures
+                    # Stop scheduling new work once a failure requires rollback
                     if not task_result['success'] and workflow.rollback_on_failure:
-                        await self._rollback_workflow(workflow)
-                        return {
-                            'success': False,
-                            'error': f"Task {task_result.get('task_id', 'unknown')} failed",
-                            'completed_tasks': results
-                        }
+                        failed_result = failed_result or task_result
+                        continue
+                    
+                    if task_result['success']:
+                        if task.task_id in merged_tasks:
+                            succeeded_task_ids.update(
+                                member.task_id for member in merged_tasks[task.task_id]
+                            )
+                        else:
+                            succeeded_task_ids.add(task.task_id)
+                    
+                    # Release dependents whose dependencies have all finished
+                    for dependent_id in dependents[task.task_id]:
+                        pending_dependencies[dependent_id].discard(task.task_id)
+                        if not pending_dependencies[dependent_id]:
+                            mark_ready(tasks_by_id[dependent_id])
+            
+            if workflow.workflow_id not in self.active_workflows:
+                return {
+                    'success': False,
+                    'error': 'Workflow cancelled',
+                    'completed_tasks': results
+                }
+            
+            if failed_result:
+                await self._rollback_workflow(workflow)
+                return {
+                    'success': False,
+                    'error': f"Task {failed_result.get('task_id', 'unknown')} failed",
+                    'completed_tasks': results
+                }
+            
+            if len(results) < len(workflow.tasks):
+                return {
+                    'success': False,
+                    'error': 'Workflow has circular task dependencies',
+                    'completed_tasks': results
+                }
             
             return {
                 'success': True,
@@ -346,6 +744,101 @@ class AutonomousExecutionEngine:
                 'error': str(e),
                 'completed_tasks': results if 'results' in locals() else []
             }
+        
+        finally:
+            self._workflow_handles.pop(workflow.workflow_id, None)
+            for merged_id in merged_tasks:
+                self._task_workflows.pop(merged_id, None)
+
+    def _coalesce_file_updates(self, tasks: List[ExecutionTask]):
+        """Merge GitHub update_file tasks that share a branch and dependencies"""
+        groups = defaultdict(list)
+        for task in tasks:
+            if (task.task_type.lower() == 'github_operation' and
+                    task.parameters.get('operation') == 'update_file'):
+                key = (
+                    task.parameters.get('repository'),
+                    task.parameters.get('branch_name', 'main'),
+                    frozenset(task.dependencies)
+                )
+                groups[key].append(task)
+        
+        merged_tasks = {}
+        replaced = {}
+        taken_ids = {task.task_id for task in tasks}
+        for (repo_name, branch_name, _), members in groups.items():
+            if len(members) < 2:
+                continue
+            
+            # The batch id must not shadow a real task or another batch
+            merged_id = f"{members[0].task_id}_batch"
+            suffix = 1
+            while merged_id in taken_ids:
+                suffix += 1
+                merged_id = f"{members[0].task_id}_batch{suffix}"
+            taken_ids.add(merged_id)
+            
+            resource_requirements = defaultdict(int)
+            for member in members:
+                for resource_type, amount in member.parameters.get('resource_requirements', {}).items():
+                    resource_requirements[resource_type] = max(resource_requirements[resource_type], amount)
+            
+            commit_messages = list(dict.fromkeys(
+                member.parameters.get('commit_message', f"Update {member.parameters['file_path']}")
+                for member in members
+            ))
+            
+            merged_task = ExecutionTask(
+                task_id=merged_id,
+                task_type='github_operation',
+                description=f"Batched update of {len(members)} files",
+                priority=min(
+                    (member.priority for member in members),
+                    key=lambda priority: PRIORITY_RANK.get(priority, len(PRIORITY_RANK))
+                ),
+                parameters={
+                    'operation': 'commit_files',
+                    'repository': repo_name,
+                    'branch_name': branch_name,
+                    'files': [
+                        {'path': member.parameters['file_path'], 'content': member.parameters['content']}
+                        for member in members
+                    ],
+                    'commit_message': '\n'.join(commit_messages),
+                    'resource_requirements': dict(resource_requirements)
+                },
+                dependencies=list(members[0].dependencies),
+                timeout_seconds=max(member.timeout_seconds for member in members),
+                retry_count=0,
+                max_retries=max(member.max_retries for member in members)
+            )
+            merged_tasks[merged_task.task_id] = members
+            replaced[members[0].task_id] = merged_task
+            for member in members[1:]:
+                replaced[member.task_id] = None
+        
+        if not merged_tasks:
+            return tasks, merged_tasks
+        
+        scheduled_tasks = [
+            replaced.get(task.task_id, task) for task in tasks
+            if replaced.get(task.task_id, task) is not None
+        ]
+        return scheduled_tasks, merged_tasks
+
+    def _expand_merged_result(self, members: List[ExecutionTask], merged_task: ExecutionTask,
+                              merged_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Copy a batched commit result back onto the original update_file tasks"""
+        member_results = []
+        for member in members:
+            member_result = {**merged_result, 'task_id': member.task_id}
+            member.status = merged_task.status
+            member.start_time = merged_task.start_time
+            member.end_time = merged_task.end_time
+            member.error = merged_task.error
+            member.result = member_result
+            member_results.append(member_result)
+        return member_results
 
     async def execute_task(self, task: ExecutionTask) -> Dict[str, Any]:
         """
@@ -358,33 +851,70 @@ class AutonomousExecutionEngine:
             Dict containing execution result
         """
         try:
+            # Serve idempotent and recovered tasks from cached results when possible
+            idempotent = task.parameters.get('idempotent')
+            fingerprint = None
+            if idempotent or self._journal:
+                fingerprint = self._task_fingerprint(task)
+                cached_result = self._lookup_cached_result(task, fingerprint, idempotent)
+                if cached_result:
+                    result = {**cached_result, 'task_id': task.task_id, 'cached': True}
+                    task.result = result
+                    task.status = ExecutionStatus.COMPLETED
+                    self.logger.info(f"Task {task.task_id} served from result cache")
+                    return result
+            
             self.logger.info(f"Executing task: {task.task_id} ({task.task_type})")
             
             task.status = ExecutionStatus.RUNNING
             task.start_time = time.time()
             
-            self.active_tasks[task.task_id] = task
+            self._activate_task(task)
+            heapq.heappush(
+                self._timeout_heap, (task.start_time + task.timeout_seconds, task.task_id)
+            )
+            self._timeout_event.set()
             
             # Check resource availability
             if not await self._allocate_resources(task):
+                if self._take_expired(task):
+                    return await self._timeout_result(task)
+                task.status = ExecutionStatus.FAILED
+                task.error = 'Insufficient resources available'
+                task.end_time = time.time()
+                self._deactivate_task(task)
                 return {
                     'success': False,
                     'error': 'Insufficient resources available',
                     'task_id': task.task_id
                 }
             
+            # Expired while waiting for resources: give the grant back instead of running
+            if self._take_expired(task):
+                return await self._timeout_result(task)
+            
             # Execute task based on type
             result = await self._execute_task_by_type(task)
             
+            # The watchdog already failed this task; drop the late result
+            if self._take_expired(task):
+                return await self._timeout_result(task)
+            
             task.end_time = time.time()
             task.result = result
             task.status = ExecutionStatus.COMPLETED if result['success'] else ExecutionStatus.FAILED
             
+            # Remove from active tasks before any await so the watchdog cannot expire it now
+            self._deactivate_task(task)
+            
             # Release resources
             await self._release_resources(task)
             
-            # Remove from active tasks
-            del self.active_tasks[task.task_id]
+            # Cache and journal successful results
+            if fingerprint and result['success']:
+                if idempotent:
+                    self._result_cache[fingerprint] = (time.time(), result)
+                await self._journal_task(task, fingerprint, result)
             
             # Update metrics
             self.execution_metrics['total_tasks_executed'] += 1
@@ -393,11 +923,23 @@ class AutonomousExecutionEngine:
             else:
                 self.execution_metrics['failed_executions'] += 1
             
+            # Welford's online mean/variance
             execution_time = task.end_time - task.start_time
-            self.execution_metrics['average_execution_time'] = (
-                (self.execution_metrics['average_execution_time'] * 
-                 (self.execution_metrics['total_tasks_executed'] - 1) + execution_time) /
-                self.execution_metrics['total_tasks_executed']
+            count = self.execution_metrics['total_tasks_executed']
+            previous_mean = self.execution_metrics['average_execution_time']
+            mean = previous_mean + (execution_time - previous_mean) / count
+            self._execution_time_m2 += (execution_time - previous_mean) * (execution_time - mean)
+            self.execution_metrics['average_execution_time'] = mean
+            self.execution_metrics['execution_time_stddev'] = (
+                (self._execution_time_m2 / (count - 1)) ** 0.5 if count > 1 else 0.0
+            )
+            
+            # Exponential moving average of runtime per task type, used for scheduling
+            runtime_estimates = self.execution_metrics['task_runtime_estimates']
+            previous_estimate = runtime_estimates.get(task.task_type)
+            runtime_estimates[task.task_type] = (
+                execution_time if previous_estimate is None
+                else previous_estimate + self.runtime_ema_alpha * (execution_time - previous_estimate)
             )
             
             self.logger.info(
@@ -407,7 +949,24 @@ class AutonomousExecutionEngine:
             
             return result
             
+        except asyncio.CancelledError:
+            # Cancelled by the timeout watchdog rather than by a caller
+            if self._take_expired(task):
+                return await self._timeout_result(task)
+            
+            self.logger.info(f"Task {task.task_id} cancelled")
+            task.status = ExecutionStatus.FAILED
+            task.error = 'Task cancelled'
+            task.end_time = time.time()
+            
+            await self._release_resources(task)
+            self._deactivate_task(task)
+            raise
+            
         except Exception as e:
+            if self._take_expired(task):
+                return await self._timeout_result(task)
+            
             self.logger.error(f"Error executing task {task.task_id}: {e}")
             task.status = ExecutionStatus.FAILED
             task.error = str(e)
@@ -415,8 +974,7 @@ class AutonomousExecutionEngine:
             
             # Release resources and cleanup
             await self._release_resources(task)
-            if task.task_id in self.active_tasks:
-                del self.active_tasks[task.task_id]
+            self._deactivate_task(task)
             
             return {
                 'success': False,
@@ -424,34 +982,110 @@ class AutonomousExecutionEngine:
                 'task_id': task.task_id
             }
 
+    def _take_expired(self, task: ExecutionTask) -> bool:
+        """Consume the watchdog's expiry mark for a task, if it has one"""
+        if self._expired_tasks.get(task.task_id) is not task:
+            return False
+        del self._expired_tasks[task.task_id]
+        return True
+
+    async def _timeout_result(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Release anything a task stopped by the timeout watchdog still holds and report it"""
+        await self._release_resources(task)
+        return {
+            'success': False,
+            'error': task.error,
+            'task_id': task.task_id
+        }
+
+    def _activate_task(self, task: ExecutionTask):
+        """Track a running task, indexed by its workflow"""
+        self.active_tasks[task.task_id] = task
+        workflow_id = self._task_workflows.get(task.task_id)
+        if workflow_id:
+            self._workflow_active_tasks[workflow_id].add(task.task_id)
+
+    def _deactivate_task(self, task: ExecutionTask):
+        """Stop tracking a task that is no longer running"""
+        if self.active_tasks.get(task.task_id) is not task:
+            return  # Already deactivated, or the id now belongs to a newer task
+        del self.active_tasks[task.task_id]
+        workflow_id = self._task_workflows.get(task.task_id)
+        workflow_tasks = self._workflow_active_tasks.get(workflow_id)
+        if workflow_tasks is not None:
+            workflow_tasks.discard(task.task_id)
+            if not workflow_tasks:
+                del self._workflow_active_tasks[workflow_id]
+
+    def _task_fingerprint(self, task: ExecutionTask) -> str:
+        """Compute a content-addressed fingerprint for a task"""
+        payload = json.dumps(
+            [task.task_type, task.parameters], sort_keys=True, default=str
+        )
+        return _FINGERPRINT_PREFIX + _fingerprint_hasher(payload.encode('utf-8')).hexdigest()
+
+    def _lookup_cached_result(self, task: ExecutionTask, fingerprint: str,
+                              idempotent: bool) -> Optional[Dict[str, Any]]:
+        """Find a reusable result for a task"""
+        # Recovered results are consumed once, by the same task in a re-run of its interrupted workflow
+        recovered_tasks = self._recovered_results.get(self._task_workflows.get(task.task_id))
+        if recovered_tasks:
+            recovered = recovered_tasks.pop(task.task_id, None)
+            if recovered and recovered['f'] == fingerprint:
+                return recovered['r']
+        
+        if idempotent:
+            cached = self._result_cache.get(fingerprint)
+            if cached and time.time() - cached[0] < self.result_cache_ttl:
+                return cached[1]
+        
+        return None
+
+    def _evict_result_cache(self):
+        """Remove expired entries from the result cache"""
+        try:
+            current_time = time.time()
+            expired = [
+                fingerprint for fingerprint, (cached_at, _) in self._result_cache.items()
+                if current_time - cached_at >= self.result_cache_ttl
+            ]
+            for fingerprint in expired:
+                del self._result_cache[fingerprint]
+            
+            # Forget recovered workflows that were not re-run within the recovery window
+            if self._recovered_results:
+                cutoff = current_time - self.journal_recovery_ttl
+                stale_workflows = [
+                    workflow_id for workflow_id, recovered_tasks in self._recovered_results.items()
+                    if all(entry['ts'] < cutoff for entry in recovered_tasks.values())
+                ]
+                for workflow_id in stale_workflows:
+                    del self._recovered_results[workflow_id]
+            
+        except Exception as e:
+            self.logger.error(f"Error evicting result cache: {e}")
+
     async def _execute_task_by_type(self, task: ExecutionTask) -> Dict[str, Any]:
         """Execute task based on its type"""
+        task_type = task.task_type.lower()
+        handler = self._task_dispatch.get(task_type)
+        
+        if handler:
+            return await self._safe_dispatch(handler, task)
+        else:
+            return {
+                'success': False,
+                'error': f'Unknown task type: {task_type}',
+                'task_id': task.task_id
+            }
+
+    async def _safe_dispatch(self, handler: Callable, task: ExecutionTask) -> Dict[str, Any]:
+        """Run a task handler, turning any exception into a failed result"""
         try:
-            task_type = task.task_type.lower()
-            
-            if task_type == 'github_operation':
-                return await self._execute_github_task(task)
-            elif task_type == 'api_call':
-                return await self._execute_api_call_task(task)
-            elif task_type == 'file_operation':
-                return await self._execute_file_operation_task(task)
-            elif task_type == 'data_processing':
-                return await self._execute_data_processing_task(task)
-            elif task_type == 'monitoring':
-                return await self._execute_monitoring_task(task)
-            elif task_type == 'notification':
-                return await self._execute_notification_task(task)
-            elif task_type == 'system_command':
-                return await self._execute_system_command_task(task)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unknown task type: {task_type}',
-                    'task_id': task.task_id
-                }
-                
+            return await handler(task)
+            
         except Exception as e:
-            self.logger.error(f"Error executing task type {task.task_type}: {e}")
+            self.logger.error(f"Error executing {task.task_type} task {task.task_id}: {e}")
             return {
                 'success': False,
                 'error': str(e),
@@ -460,499 +1094,613 @@ class AutonomousExecutionEngine:
 
     async def _execute_github_task(self, task: ExecutionTask) -> Dict[str, Any]:
         """Execute GitHub-related tasks"""
-        try:
-            if not self.github_client:
-                return {
-                    'success': False,
-                    'error': 'GitHub client not initialized',
-                    'task_id': task.task_id
-                }
-            
-            operation = task.parameters.get('operation')
-            repo_name = task.parameters.get('repository')
-            
-            if operation == 'create_branch':
-                return await self._github_create_branch(task)
-            elif operation == 'commit_files':
-                return await self._github_commit_files(task)
-            elif operation == 'create_pull_request':
-                return await self._github_create_pull_request(task)
-            elif operation == 'merge_pull_request':
-                return await self._github_merge_pull_request(task)
-            elif operation == 'create_issue':
-                return await self._github_create_issue(task)
-            elif operation == 'update_file':
-                return await self._github_update_file(task)
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unknown GitHub operation: {operation}',
-                    'task_id': task.task_id
-                }
-                
-        except Exception as e:
-            self.logger.error(f"Error executing GitHub task: {e}")
+        if not self.github_client:
             return {
                 'success': False,
-                'error': str(e),
+                'error': 'GitHub client not initialized',
+                'task_id': task.task_id
+            }
+        
+        operation = task.parameters.get('operation')
+        handler = self._github_dispatch.get(operation)
+        
+        if handler:
+            return await handler(task)
+        else:
+            return {
+                'success': False,
+                'error': f'Unknown GitHub operation: {operation}',
                 'task_id': task.task_id
             }
 
+    def _get_repo(self, repo_name: str):
+        """Get a GitHub repository object, reusing cached lookups within the TTL"""
+        current_time = time.time()
+        cached = self._repo_cache.get(repo_name)
+        if cached and current_time - cached[0] < self.repo_cache_ttl:
+            return cached[1]
+        
+        repo = self.github_client.get_repo(repo_name)
+        self._repo_cache[repo_name] = (current_time, repo)
+        return repo
+
+    async def _run_github_call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking PyGithub call in a worker thread"""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def _github_create_branch(self, task: ExecutionTask) -> Dict[str, Any]:
         """Create a new branch in GitHub repository"""
-        try:
-            repo_name = task.parameters['repository']
-            branch_name = task.parameters['branch_name']
-            base_branch = task.parameters.get('base_branch', 'main')
-            
-            repo = self.github_client.get_repo(repo_name)
-            base_ref = repo.get_git_ref(f'heads/{base_branch}')
-            
-            new_ref = repo.create_git_ref(
-                ref=f'refs/heads/{branch_name}',
-                sha=base_ref.object.sha
-            )
+        repo_name = task.parameters['repository']
+        branch_name = task.parameters['branch_name']
+        base_branch = task.parameters.get('base_branch', 'main')
+        
+        repo = await self._run_github_call(self._get_repo, repo_name)
+        base_ref = await self._run_github_call(repo.get_git_ref, f'heads/{base_branch}')
+        
+        new_ref = await self._run_github_call(
+            repo.create_git_ref,
+            ref=f'refs/heads/{branch_name}',
+            sha=base_ref.object.sha
+        )
+        
+        return {
+            'success': True,
+            'result': {
+                'branch_name': branch_name,
+                'sha': new_ref.object.sha,
+                'url': new_ref.url
+            },
+            'task_id': task.task_id
+        }
+
+    async def _github_commit_files(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Commit files to GitHub repository"""
+        repo_name = task.parameters['repository']
+        branch_name = task.parameters['branch_name']
+        files = task.parameters['files']  # List of {'path': str, 'content': str}
+        commit_message = task.parameters['commit_message']
+        
+        return {
+            'success': True,
+            'result': await self._commit_files_to_branch(
+                repo_name, branch_name, files, commit_message
+            ),
+            'task_id': task.task_id
+        }
+
+    async def _github_update_file(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Update a single file in GitHub repository"""
+        repo_name = task.parameters['repository']
+        branch_name = task.parameters.get('branch_name', 'main')
+        file_path = task.parameters['file_path']
+        commit_message = task.parameters.get('commit_message', f'Update {file_path}')
+        files = [{'path': file_path, 'content': task.parameters['content']}]
+        
+        return {
+            'success': True,
+            'result': await self._commit_files_to_branch(
+                repo_name, branch_name, files, commit_message
+            ),
+            'task_id': task.task_id
+        }
+
+    async def _commit_files_to_branch(self, repo_name: str, branch_name: str,
+                                      files: List[Dict[str, str]], commit_message: str) -> Dict[str, Any]:
+        """Create a single commit containing all files on the given branch"""
+        repo = await self._run_github_call(self._get_repo, repo_name)
+        
+        # Get the latest commit on the branch
+        branch_ref = await self._run_github_call(repo.get_git_ref, f'heads/{branch_name}')
+        latest_commit = await self._run_github_call(
+            repo.get_git_commit, branch_ref.object.sha
+        )
+        
+        # Create blobs for all files concurrently
+        created_blobs = await asyncio.gather(*[
+            self._run_github_call(repo.create_git_blob, file_info['content'], 'utf-8')
+            for file_info in files
+        ])
+        blobs = [
+            {
+                'path': file_info['path'],
+                'mode': '100644',
+                'type': 'blob',
+                'sha': blob.sha
+            }
+            for file_info, blob in zip(files, created_blobs)
+        ]
+        
+        # Create tree
+        tree = await self._run_github_call(repo.create_git_tree, blobs, latest_commit.tree)
+        
+        # Create commit
+        commit = await self._run_github_call(
+            repo.create_git_commit,
+            message=commit_message,
+            tree=tree,
+            parents=[latest_commit]
+        )
+        
+        # Update branch reference
+        await self._run_github_call(branch_ref.edit, commit.sha)
+        
+        return {
+            'commit_sha': commit.sha,
+            'commit_url': commit.html_url,
+            'files_committed': len(files)
+        }
+
+    async def _github_create_pull_request(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Create a pull request in GitHub repository"""
+        repo_name = task.parameters['repository']
+        title = task.parameters['title']
+        body = task.parameters.get('body', '')
+        head_branch = task.parameters['head_branch']
+        base_branch = task.parameters.get('base_branch', 'main')
+        
+        repo = await self._run_github_call(self._get_repo, repo_name)
+        
+        pr = await self._run_github_call(
+            repo.create_pull,
+            title=title,
+            body=body,
+            head=head_branch,
+            base=base_branch
+        )
+        
+        return {
+            'success': True,
+            'result': {
+                'pr_number': pr.number,
+                'pr_url': pr.html_url,
+                'state': pr.state
+            },
+            'task_id': task.task_id
+        }
+
+    async def _execute_api_call_task(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Execute API call tasks"""
+        url = task.parameters['url']
+        method = task.parameters.get('method', 'GET').upper()
+        headers = task.parameters.get('headers', {})
+        data = task.parameters.get('data')
+        params = task.parameters.get('params')
+        timeout = task.parameters.get('timeout', 30)
+        
+        async with self.http_session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            json=data if data else None,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            body = await response.read()
+            
+            # Parse JSON bodies straight from bytes; decode everything else once
+            response_data = None
+            if body and 'json' in response.content_type:
+                try:
+                    response_data = _json_loads(body)
+                except ValueError:
+                    response_data = None
+            if response_data is None:
+                response_data = body.decode(response.charset or 'utf-8', errors='replace')
             
             return {
-                'success': True,
+                'success': response.status < 400,
                 'result': {
-                    'branch_name': branch_name,
-                    'sha': new_ref.object.sha,
-                    'url': new_ref.url
+                    'status_code': response.status,
+                    'response_data': response_data,
+                    'headers': dict(response.headers)
                 },
                 'task_id': task.task_id
             }
-            
-        except Exception as e:
+
+    async def _execute_file_operation_task(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Execute file operation tasks"""
+        operation = task.parameters['operation']
+        file_path = task.parameters['file_path']
+        
+        if operation == 'read':
+            content = await self._read_file(file_path)
             return {
-                'success': False,
-                'error': str(e),
+                'success': True,
+                'result': {'content': content, 'file_path': file_path},
                 'task_id': task.task_id
             }
-
-    async def _github_commit_files(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Commit files to GitHub repository"""
-        try:
-            repo_name = task.parameters['repository']
-            branch_name = task.parameters['branch_name']
-            files = task.parameters['files']  # List of {'path': str, 'content': str}
-            commit_message = task.parameters['commit_message']
-            
-            repo = self.github_client.get_repo(repo_name)
-            
-            # Get the latest commit on the branch
-            branch_ref = repo.get_git_ref(f'heads/{branch_name}')
-            latest_commit = repo.get_git_commit(branch_ref.object.sha)
-            
-            # Create blobs for each file
-            blobs = []
-            for file_info in files:
-                blob = repo.create_git_blob(file_info['content'], 'utf-8')
-                blobs.append({
-                    'path': file_info['path'],
-                    'mode': '100644',
-                    'type': 'blob',
-                    'sha': blob.sha
-                })
-            
-            # Create tree
-            tree = repo.create_git_tree(blobs, latest_commit.tree)
-            
-            # Create commit
-            commit = repo.create_git_commit(
-                message=commit_message,
-                tree=tree,
-                parents=[latest_commit]
-            )
-            
-            # Update branch reference
-            branch_ref.edit(commit.sha)
             
+        elif operation == 'write':
+            content = task.parameters['content']
+            bytes_written = len(content.encode('utf-8'))
+            await self._write_file(file_path, content, 'w')
             return {
                 'success': True,
-                'result': {
-                    'commit_sha': commit.sha,
-                    'commit_url': commit.html_url,
-                    'files_committed': len(files)
-                },
+                'result': {'file_path': file_path, 'bytes_written': bytes_written},
                 'task_id': task.task_id
             }
             
-        except Exception as e:
+        elif operation == 'append':
+            content = task.parameters['content']
+            bytes_appended = len(content.encode('utf-8'))
+            await self._write_file(file_path, content, 'a')
             return {
-                'success': False,
-                'error': str(e),
+                'success': True,
+                'result': {'file_path': file_path, 'bytes_appended': bytes_appended},
                 'task_id': task.task_id
             }
-
-    async def _github_create_pull_request(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Create a pull request in GitHub repository"""
-        try:
-            repo_name = task.parameters['repository']
-            title = task.parameters['title']
-            body = task.parameters.get('body', '')
-            head_branch = task.parameters['head_branch']
-            base_branch = task.parameters.get('base_branch', 'main')
-            
-            repo = self.github_client.get_repo(repo_name)
-            
-            pr = repo.create_pull(
-                title=title,
-                body=body,
-                head=head_branch,
-                base=base_branch
-            )
             
+        elif operation == 'delete':
+            await asyncio.to_thread(os.remove, file_path)
             return {
                 'success': True,
-                'result': {
-                    'pr_number': pr.number,
-                    'pr_url': pr.html_url,
-                    'state': pr.state
-                },
+                'result': {'file_path': file_path, 'deleted': True},
                 'task_id': task.task_id
             }
             
-        except Exception as e:
+        else:
             return {
                 'success': False,
-                'error': str(e),
+                'error': f'Unknown file operation: {operation}',
                 'task_id': task.task_id
             }
 
-    async def _execute_api_call_task(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Execute API call tasks"""
-        try:
-            url = task.parameters['url']
-            method = task.parameters.get('method', 'GET').upper()
-            headers = task.parameters.get('headers', {})
-            data = task.parameters.get('data')
-            params = task.parameters.get('params')
-            timeout = task.parameters.get('timeout', 30)
-            
-            async with self.http_session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data if data else None,
-                params=params,
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                response_data = await response.text()
-                
-                try:
-                    response_json = await response.json()
-                except:
-                    response_json = None
-                
-                return {
-                    'success': response.status < 400,
-                    'result': {
-                        'status_code': response.status,
-                        'response_data': response_json or response_data,
-                        'headers': dict(response.headers)
-                    },
-                    'task_id': task.task_id
-                }
+    async def _read_file(self, file_path: str) -> str:
+        """Read a text file without blocking the event loop"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                return await f.read()
+        
+        def _read() -> str:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        
+        return await asyncio.to_thread(_read)
+
+    async def _write_file(self, file_path: str, content: str, mode: str):
+        """Write or append to a text file without blocking the event loop"""
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(file_path, mode, encoding='utf-8') as f:
+                await f.write(content)
+            return
+        
+        def _write():
+            with open(file_path, mode, encoding='utf-8') as f:
+                f.write(content)
+        
+        await asyncio.to_thread(_write)
+
+    async def _execute_data_processing_task(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Execute data processing tasks"""
+        operation = task.parameters['operation']
+        data = task.parameters['data']
+        
+        if operation == 'json_parse':
+            if isinstance(data, (str, bytes, bytearray)):
+                parsed_data = _json_loads(data)
+            else:
+                parsed_data = data
                 
-        except Exception as e:
             return {
-                'success': False,
-                'error': str(e),
+                'success': True,
+                'result': {'parsed_data': parsed_data},
                 'task_id': task.task_id
             }
-
-    async def _execute_file_operation_task(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Execute file operation tasks"""
-        try:
-            operation = task.parameters['operation']
-            file_path = task.parameters['file_path']
             
-            if operation == 'read':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                return {
-                    'success': True,
-                    'result': {'content': content, 'file_path': file_path},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'write':
-                content = task.parameters['content']
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                return {
-                    'success': True,
-                    'result': {'file_path': file_path, 'bytes_written': len(content.encode('utf-8'))},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'append':
-                content = task.parameters['content']
-                with open(file_path, 'a', encoding='utf-8') as f:
-                    f.write(content)
-                return {
-                    'success': True,
-                    'result': {'file_path': file_path, 'bytes_appended': len(content.encode('utf-8'))},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'delete':
-                os.remove(file_path)
-                return {
-                    'success': True,
-                    'result': {'file_path': file_path, 'deleted': True},
-                    'task_id': task.task_id
-                }
-                
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unknown file operation: {operation}',
-                    'task_id': task.task_id
-                }
-                
-        except Exception as e:
+        elif operation == 'json_stringify':
+            json_string = _json_dumps_pretty(data)
             return {
-                'success': False,
-                'error': str(e),
+                'success': True,
+                'result': {'json_string': json_string},
                 'task_id': task.task_id
             }
-
-    async def _execute_data_processing_task(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Execute data processing tasks"""
-        try:
-            operation = task.parameters['operation']
-            data = task.parameters['data']
             
-            if operation == 'json_parse':
-                if isinstance(data, str):
-                    parsed_data = json.loads(data)
-                else:
-                    parsed_data = data
-                    
-                return {
-                    'success': True,
-                    'result': {'parsed_data': parsed_data},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'json_stringify':
-                json_string = json.dumps(data, indent=2)
-                return {
-                    'success': True,
-                    'result': {'json_string': json_string},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'filter':
-                filter_criteria = task.parameters['filter_criteria']
-                filtered_data = [
-                    item for item in data 
-                    if all(item.get(k) == v for k, v in filter_criteria.items())
-                ]
-                return {
-                    'success': True,
-                    'result': {'filtered_data': filtered_data, 'count': len(filtered_data)},
-                    'task_id': task.task_id
-                }
-                
-            elif operation == 'aggregate':
-                aggregation_type = task.parameters['aggregation_type']
-                field = task.parameters['field']
-                
-                values = [item.get(field, 0) for item in data if field in item]
-                
-                if aggregation_type == 'sum':
-                    result_value = sum(values)
-                elif aggregation_type == 'average':
-                    result_value = sum(values) / len(values) if values else 0
-                elif aggregation_type == 'count':
-                    result_value = len(values)
-                elif aggregation_type == 'max':
-                    result_value = max(values) if values else None
-                elif aggregation_type == 'min':
-                    result_value = min(values) if values else None
-                else:
+        elif operation == 'filter':
+            criteria = tuple(task.parameters['filter_criteria'].items())
+            filtered_data = [
+                item for item in data 
+                if all(item.get(k) == v for k, v in criteria)
+            ]
+            return {
+                'success': True,
+                'result': {'filtered_data': filtered_data, 'count': len(filtered_data)},
+                'task_id': task.task_id
+            }
+            
+        elif operation == 'aggregate':
+            aggregation_type = task.parameters['aggregation_type']
+            field = task.parameters['field']
+            
+            values = [item[field] for item in data if field in item]
+            
+            if aggregation_type == 'count':
+                result_value = len(values)
+            elif aggregation_type in ('sum', 'average', 'max', 'min'):
+                numeric = all(isinstance(value, (int, float)) for value in values)
+                if numeric and any(isinstance(value, float) for value in values):
+                    # Only float data takes the vectorised path; ints stay exact
+                    array = np.fromiter(values, dtype=np.float64, count=len(values))
+                    if aggregation_type == 'sum':
+                        result_value = float(array.sum())
+                    elif aggregation_type == 'average':
+                        result_value = float(array.mean())
+                    elif aggregation_type == 'max':
+                        result_value = float(array.max())
+                    else:
+                        result_value = float(array.min())
+                elif aggregation_type in ('max', 'min'):
+                    # Any mutually comparable values work, as before
+                    reducer = max if aggregation_type == 'max' else min
+                    result_value = reducer(values) if values else None
+                elif not numeric:
                     return {
                         'success': False,
-                        'error': f'Unknown aggregation type: {aggregation_type}',
+                        'error': f'Field {field} has non-numeric values',
                         'task_id': task.task_id
                     }
-                
-                return {
-                    'success': True,
-                    'result': {
-                        'aggregation_type': aggregation_type,
-                        'field': field,
-                        'value': result_value,
-                        'count': len(values)
-                    },
-                    'task_id': task.task_id
-                }
-                
-            else:
-                return {
-                    'success': False,
-                    'error': f'Unknown data processing operation: {operation}',
-                    'task_id': task.task_id
-                }
-                
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'task_id': task.task_id
-            }
-
-    async def _execute_monitoring_task(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Execute monitoring tasks"""
-        try:
-            metric_name = task.parameters['metric_name']
-            target_value = task.parameters.get('target_value')
-            comparison = task.parameters.get('comparison', 'equals')
-            timeout = task.parameters.get('timeout', 60)
-            
-            # This would typically integrate with actual monitoring systems
-            # For now, simulate monitoring by checking execution metrics
-            
-            current_value = self.execution_metrics.get(metric_name, 0)
-            
-            if comparison == 'equals':
-                condition_met = current_value == target_value
-            elif comparison == 'greater_than':
-                condition_met = current_value > target_value
-            elif comparison == 'less_than':
-                condition_met = current_value < target_value
-            elif comparison == 'greater_equal':
-                condition_met = current_value >= target_value
-            elif comparison == 'less_equal':
-                condition_met = current_value <= target_value
+                elif aggregation_type == 'sum':
+                    result_value = sum(values)
+                else:
+                    result_value = sum(values) / len(values) if values else 0
             else:
                 return {
                     'success': False,
-                    'error': f'Unknown comparison operator: {comparison}',
+                    'error': f'Unknown aggregation type: {aggregation_type}',
                     'task_id': task.task_id
                 }
             
             return {
                 'success': True,
                 'result': {
-                    'metric_name': metric_name,
-                    'current_value': current_value,
-                    'target_value': target_value,
-                    'comparison': comparison,
-                    'condition_met': condition_met
+                    'aggregation_type': aggregation_type,
+                    'field': field,
+                    'value': result_value,
+                    'count': len(values)
                 },
                 'task_id': task.task_id
             }
             
-        except Exception as e:
+        else:
             return {
                 'success': False,
-                'error': str(e),
+                'error': f'Unknown data processing operation: {operation}',
                 'task_id': task.task_id
             }
 
-    async def _execute_notification_task(self, task: ExecutionTask) -> Dict[str, Any]:
-        """Execute notification tasks"""
-        try:
-            notification_type = task.parameters['type']
-            message = task.parameters['message']
-            recipients = task.parameters.get('recipients', [])
-            
-            # Log notification (in production, this would send actual notifications)
-            self.logger.info(f"NOTIFICATION [{notification_type}]: {message}")
-            
-            if recipients:
-                self.logger.info(f"Recipients: {', '.join(recipients)}")
-            
-            return {
-                'success': True,
-                'result': {
-                    'notification_type': notification_type,
-                    'message': message,
-                    'recipients_count': len(recipients),
-                    'sent_at': time.time()
-                },
-                'task_id': task.task_id
-            }
-            
-        except Exception as e:
+    async def _execute_monitoring_task(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Execute monitoring tasks"""
+        metric_name = task.parameters['metric_name']
+        target_value = task.parameters.get('target_value')
+        comparison = task.parameters.get('comparison', 'equals')
+        timeout = task.parameters.get('timeout', 60)
+        
+        # This would typically integrate with actual monitoring systems
+        # For now, simulate monitoring by checking execution metrics
+        
+        current_value = self.execution_metrics.get(metric_name, 0)
+        
+        compare = MONITORING_COMPARISONS.get(comparison)
+        if compare is None:
             return {
                 'success': False,
-                'error': str(e),
+                'error': f'Unknown comparison operator: {comparison}',
                 'task_id': task.task_id
             }
+        
+        condition_met = compare(current_value, target_value)
+        
+        return {
+            'success': True,
+            'result': {
+                'metric_name': metric_name,
+                'current_value': current_value,
+                'target_value': target_value,
+                'comparison': comparison,
+                'condition_met': condition_met
+            },
+            'task_id': task.task_id
+        }
+
+    async def _execute_notification_task(self, task: ExecutionTask) -> Dict[str, Any]:
+        """Execute notification tasks"""
+        notification_type = task.parameters['type']
+        message = task.parameters['message']
+        recipients = task.parameters.get('recipients', [])
+        
+        # Log notification (in production, this would send actual notifications)
+        self.logger.info(f"NOTIFICATION [{notification_type}]: {message}")
+        
+        if recipients:
+            self.logger.info(f"Recipients: {', '.join(recipients)}")
+        
+        return {
+            'success': True,
+            'result': {
+                'notification_type': notification_type,
+                'message': message,
+                'recipients_count': len(recipients),
+                'sent_at': time.time()
+            },
+            'task_id': task.task_id
+        }
 
     async def _execute_system_command_task(self, task: ExecutionTask) -> Dict[str, Any]:
         """Execute system command tasks"""
-        try:
-            command = task.parameters['command']
-            working_directory = task.parameters.get('working_directory', '.')
-            timeout = task.parameters.get('timeout', 60)
-            
-            # Execute command using asyncio subprocess
+        command = task.parameters['command']
+        working_directory = task.parameters.get('working_directory', '.')
+        timeout = task.parameters.get('timeout', 60)
+        
+        # Plain commands are exec'd directly; only shell syntax pays for /bin/sh
+        args = None
+        if not SHELL_METACHARACTERS.search(command):
+            args = shlex.split(command)
+            if args and ('=' in args[0] or args[0] in SHELL_BUILTINS):
+                args = None  # Leading VAR=value assignments and builtins need a shell
+        
+        if args:
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=working_directory,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=SUBPROCESS_STREAM_LIMIT
+            )
+        else:
             process = await asyncio.create_subprocess_shell(
                 command,
                 cwd=working_directory,
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=SUBPROCESS_STREAM_LIMIT
             )
-            
-            try:
+        
+        try:
+            if task.parameters.get('stream_output'):
+                # Keep only the last lines of verbose output in memory
+                max_lines = task.parameters.get('max_output_lines', 1000)
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_stream_tail(process.stdout, max_lines),
+                        self._read_stream_tail(process.stderr, max_lines),
+                        process.wait()
+                    ),
+                    timeout=timeout
+                )
+            elif 'max_output_bytes' in task.parameters:
+                # Read bounded output directly; commands exceeding it are killed
+                max_output_bytes = task.parameters['max_output_bytes']
+                (stdout, stdout_exceeded), (stderr, stderr_exceeded), _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._read_stream_bounded(process, process.stdout, max_output_bytes),
+                        self._read_stream_bounded(process, process.stderr, max_output_bytes),
+                        process.wait()
+                    ),
+                    timeout=timeout
+                )
+                if stdout_exceeded or stderr_exceeded:
+                    return {
+                        'success': False,
+                        'error': f'Command output exceeded {max_output_bytes} bytes',
+                        'task_id': task.task_id
+                    }
+            else:
                 stdout, stderr = await asyncio.wait_for(
                     process.communicate(), 
                     timeout=timeout
                 )
-                
-                return {
-                    'success': process.returncode == 0,
-                    'result': {
-                        'return_code': process.returncode,
-                        'stdout': stdout.decode('utf-8') if stdout else '',
-                        'stderr': stderr.decode('utf-8') if stderr else '',
-                        'command': command
-                    },
-                    'task_id': task.task_id
-                }
-                
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                return {
-                    'success': False,
-                    'error': f'Command timed out after {timeout} seconds',
-                    'task_id': task.task_id
-                }
-                
-        except Exception as e:
+            
+            # Binary output is returned as raw bytes without decoding
+            if not task.parameters.get('binary_output'):
+                stdout = stdout.decode('utf-8', errors='replace')
+                stderr = stderr.decode('utf-8', errors='replace')
+            
+            return {
+                'success': process.returncode == 0,
+                'result': {
+                    'return_code': process.returncode,
+                    'stdout': stdout,
+                    'stderr': stderr,
+                    'command': command
+                },
+                'task_id': task.task_id
+            }
+            
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
             return {
                 'success': False,
-                'error': str(e),
+                'error': f'Command timed out after {timeout} seconds',
                 'task_id': task.task_id
             }
+        
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+    async def _read_stream_bounded(self, process: asyncio.subprocess.Process,
+                                   stream: asyncio.StreamReader, max_bytes: int):
+        """Read at most max_bytes from a subprocess stream, killing the process on overflow"""
+        try:
+            data = await stream.readexactly(max_bytes + 1)
+        except asyncio.IncompleteReadError as e:
+            return e.partial, False
+        
+        if process.returncode is None:
+            process.kill()
+        return data[:max_bytes], True
+
+    async def _read_stream_tail(self, stream: asyncio.StreamReader, max_lines: int) -> bytes:
+        """Read a subprocess stream in large chunks, keeping only the last max_lines"""
+        chunks = deque()
+        buffered_lines = 0
+        while True:
+            chunk = await stream.read(SUBPROCESS_READ_CHUNK)
+            if not chunk:
+                break
+            line_count = chunk.count(b'\n')
+            chunks.append((chunk, line_count))
+            buffered_lines += line_count
+            
+            # Drop leading chunks once later chunks hold the whole tail
+            while len(chunks) > 1 and buffered_lines - chunks[0][1] > max_lines:
+                buffered_lines -= chunks.popleft()[1]
+        
+        data = b''.join(chunk for chunk, _ in chunks)
+        
+        # Walk back max_lines line breaks, ignoring a trailing newline
+        start = len(data) - 1 if data.endswith(b'\n') else len(data)
+        for _ in range(max_lines):
+            start = data.rfind(b'\n', 0, start)
+            if start < 0:
+                break
+        return data[start + 1:]
 
     async def _allocate_resources(self, task: ExecutionTask) -> bool:
-        """Allocate resources for task execution"""
+        """Allocate resources for task execution, waiting for capacity if needed"""
         try:
-            required_resources = task.parameters.get('resource_requirements', {})
-            
-            # Check if resources are available
-            for resource_type, required_amount in required_resources.items():
-                if resource_type in self.resource_pools:
-                    available = (
-                        self.resource_pools[resource_type]['available'] - 
-                        self.resource_pools[resource_type]['allocated']
-                    )
-                    if available < required_amount:
-                        return False
+            required_resources = {}
+            for resource_type, required_amount in task.parameters.get('resource_requirements', {}).items():
+                pool = self.resource_pools.get(resource_type)
+                if pool is None:
+                    continue
+                # Requests larger than a pool's capacity can never be satisfied
+                if required_amount > pool.available:
+                    return False
+                required_resources[resource_type] = required_amount
             
-            # Allocate resources
-            for resource_type, required_amount in required_resources.items():
-                if resource_type in self.resource_pools:
-                    self.resource_pools[resource_type]['allocated'] += required_amount
+            if not required_resources:
+                return True
             
+            # Take pools one at a time in a fixed order so waiters cannot deadlock
+            loop = asyncio.get_event_loop()
+            deadline = loop.time() + self.resource_wait_timeout
+            granted = {}
+            try:
+                for resource_type in sorted(required_resources):
+                    required_amount = required_resources[resource_type]
+                    pool = self.resource_pools[resource_type]
+                    async with pool.condition:
+                        if pool.free < required_amount:
+                            await asyncio.wait_for(
+                                pool.condition.wait_for(
+                                    lambda pool=pool, amount=required_amount: pool.free >= amount
+                                ),
+                                timeout=max(0, deadline - loop.time())
+                            )
+                        pool.allocated += required_amount
+                    granted[resource_type] = required_amount
+                    
+            except asyncio.TimeoutError:
+                await self._return_resources(granted)
+                return False
+            except BaseException:
+                # Cancelled while waiting on a later pool: hand back what we hold
+                await self._return_resources(granted)
+                raise
+            
+            self._resource_allocations[task.task_id] = granted
             return True
             
         except Exception as e:
@@ -962,41 +1710,44 @@ class AutonomousExecutionEngine:
     async def _release_resources(self, task: ExecutionTask):
         """Release resources after task completion"""
         try:
-            required_resources = task.parameters.get('resource_requirements', {})
-            
-            for resource_type, required_amount in required_resources.items():
-                if resource_type in self.resource_pools:
-                    self.resource_pools[resource_type]['allocated'] -= required_amount
-                    # Ensure allocated doesn't go negative
-                    self.resource_pools[resource_type]['allocated'] = max(
-                        0, self.resource_pools[resource_type]['allocated']
-                    )
+            allocated_resources = self._resource_allocations.pop(task.task_id, None)
+            if allocated_resources:
+                await self._return_resources(allocated_resources)
             
         except Exception as e:
             self.logger.error(f"Error releasing resources: {e}")
 
-    async def _check_task_dependencies(self, task: ExecutionTask, completed_results: List[Dict[str, Any]]) -> bool:
-        """Check if task dependencies are satisfied"""
+    async def _bulk_release_resources(self, tasks: List[ExecutionTask]):
+        """Release resources for many tasks with one lock round-trip per pool"""
         try:
-            if not task.dependencies:
-                return True
-            
-            completed_task_ids = {result.get('task_id') for result in completed_results}
+            totals = defaultdict(int)
+            for task in tasks:
+                allocated_resources = self._resource_allocations.pop(task.task_id, None)
+                if allocated_resources:
+                    for resource_type, allocated_amount in allocated_resources.items():
+                        totals[resource_type] += allocated_amount
             
-            for dependency_id in task.dependencies:
-                if dependency_id not in completed_task_ids:
-                    return False
-                
-                # Check if dependency was successful
-                dependency_result = next(
-                    (r for r in completed_results if r.get('task_id') == dependency_id),
-                    None
-                )
-                
-                if not dependency_result or not dependency_result.get('success', False):
-                    return False
+            if totals:
+                await self._return_resources(totals)
             
-            return True
+        except Exception as e:
+            self.logger.error(f"Error releasing resources: {e}")
+
+    async def _return_resources(self, allocated_resources: Dict[str, int]):
+        """Give allocated units back to their pools and wake waiters"""
+        for resource_type, allocated_amount in allocated_resources.items():
+            pool = self.resource_pools[resource_type]
+            async with pool.condition:
+                pool.allocated -= allocated_amount
+                pool.condition.notify_all()
+
+    def _check_task_dependencies(self, task: ExecutionTask, succeeded_task_ids: set) -> bool:
+        """Check if task dependencies are satisfied"""
+        try:
+            return all(
+                dependency_id in succeeded_task_ids
+                for dependency_id in task.dependencies
+            )
             
         except Exception as e:
             self.logger.error(f"Error checking task dependencies: {e}")
@@ -1006,31 +1757,68 @@ class AutonomousExecutionEngine:
         """Analyze task dependencies and group tasks by execution level"""
         try:
             task_map = {task.task_id: task for task in tasks}
-            levels = {}
-            task_levels = {}
             
-            def get_task_level(task_id: str) -> int:
-                if task_id in task_levels:
-                    return task_levels[task_id]
-                
-                task = task_map[task_id]
-                if not task.dependencies:
-                    level = 0
-                else:
-                    max_dep_level = max(get_task_level(dep_id) for dep_id in task.dependencies)
-                    level = max_dep_level + 1
-                
-                task_levels[task_id] = level
-                return level
+            # Fast path: when every dependency points at a root, two levels suffice
+            dependent_tasks = [
+                task for task in tasks
+                if any(dep in task_map for dep in task.dependencies)
+            ]
+            dependent_ids = {task.task_id for task in dependent_tasks}
+            if not any(
+                dep in dependent_ids for task in dependent_tasks for dep in task.dependencies
+            ):
+                roots = [task for task in tasks if task.task_id not in dependent_ids]
+                return {0: roots, 1: dependent_tasks} if dependent_tasks else {0: roots}
+            
+            shape = frozenset(
+                (task.task_id, tuple(sorted(task.dependencies))) for task in tasks
+            )
+            cached_levels = self._level_cache.get(shape)
+            if cached_levels is not None:
+                self._level_cache.move_to_end(shape)
+                return {
+                    level: [task_map[task_id] for task_id in task_ids]
+                    for level, task_ids in cached_levels.items()
+                }
             
-            # Calculate levels for all tasks
+            # Kahn's algorithm, one frontier per level
+            in_degree = {}
+            children = defaultdict(list)
             for task in tasks:
-                level = get_task_level(task.task_id)
-                if level not in levels:
-                    levels[level] = []
-                levels[level].append(task)
+                dependencies = {dep for dep in task.dependencies if dep in task_map}
+                in_degree[task.task_id] = len(dependencies)
+                for dependency_id in dependencies:
+                    children[dependency_id].append(task.task_id)
+            
+            frontier = [task.task_id for task in tasks if in_degree[task.task_id] == 0]
+            
+            level_ids = {}
+            level = 0
+            while frontier:
+                level_ids[level] = frontier
+                next_frontier = []
+                for task_id in frontier:
+                    for child_id in children[task_id]:
+                        in_degree[child_id] -= 1
+                        if in_degree[child_id] == 0:
+                            next_frontier.append(child_id)
+                frontier = next_frontier
+                level += 1
+            
+            resolved = sum(len(task_ids) for task_ids in level_ids.values())
+            if resolved < len(tasks):
+                self.logger.warning(
+                    f"{len(tasks) - resolved} tasks are part of a dependency cycle"
+                )
+            
+            self._level_cache[shape] = level_ids
+            if len(self._level_cache) > self.level_cache_size:
+                self._level_cache.popitem(last=False)
             
-            return levels
+            return {
+                level: [task_map[task_id] for task_id in task_ids]
+                for level, task_ids in level_ids.items()
+            }
             
         except Exception as e:
             self.logger.error(f"Error analyzing task dependencies: {e}")
@@ -1041,10 +1829,19 @@ class AutonomousExecutionEngine:
         try:
             self.logger.info(f"Rolling back workflow: {workflow.workflow_id}")
             
-            # Execute rollback tasks in reverse order
-            for task in reversed(workflow.tasks):
-                if task.status == ExecutionStatus.COMPLETED and task.rollback_data:
-                    await self._rollback_task(task)
+            if workflow.parallel_execution:
+                # Undo levels in reverse; tasks within a level are independent
+                task_levels = self._analyze_task_dependencies(workflow.tasks)
+                for level in sorted(task_levels, reverse=True):
+                    await asyncio.gather(*(
+                        self._rollback_task(task) for task in task_levels[level]
+                        if task.status == ExecutionStatus.COMPLETED and task.rollback_data
+                    ))
+            else:
+                # Execute rollback tasks in reverse order
+                for task in reversed(workflow.tasks):
+                    if task.status == ExecutionStatus.COMPLETED and task.rollback_data:
+                        await self._rollback_task(task)
             
             workflow.status = ExecutionStatus.ROLLED_BACK
             self.logger.info(f"Workflow {workflow.workflow_id} rolled back successfully")
@@ -1058,6 +1855,10 @@ class AutonomousExecutionEngine:
             if not task.rollback_data:
                 return
             
+            if await self._rollback_already_applied(task):
+                self.logger.info(f"Task {task.task_id} already rolled back, skipping")
+                return
+            
             rollback_task = ExecutionTask(
                 task_id=f"{task.task_id}_rollback",
                 task_type=task.rollback_data.get('type', task.task_type),
@@ -1073,6 +1874,7 @@ class AutonomousExecutionEngine:
             result = await self.execute_task(rollback_task)
             
             if result['success']:
+                self._rollback_cache.add(task.task_id)
                 self.logger.info(f"Task {task.task_id} rolled back successfully")
             else:
                 self.logger.error(f"Failed to rollback task {task.task_id}: {result.get('error')}")
@@ -1080,6 +1882,19 @@ class AutonomousExecutionEngine:
         except Exception as e:
             self.logger.error(f"Error rolling back task {task.task_id}: {e}")
 
+    async def _rollback_already_applied(self, task: ExecutionTask) -> bool:
+        """Check whether a task's rollback has already taken effect"""
+        if task.task_id in self._rollback_cache or task.rollback_data.get('idempotent_already_done'):
+            return True
+        
+        # Optional target state, e.g. {'path': 'created.txt', 'exists': False}
+        verification = task.rollback_data.get('verification')
+        if not verification or 'path' not in verification:
+            return False
+        
+        exists = await asyncio.to_thread(os.path.exists, verification['path'])
+        return exists == verification.get('exists', False)
+
     async def _monitoring_loop(self):
         """Background monitoring loop"""
         while True:
@@ -1088,19 +1903,10 @@ class AutonomousExecutionEngine:
                 
                 # Update resource utilization metrics
                 for resource_type, pool in self.resource_pools.items():
-                    utilization = pool['allocated'] / pool['available'] if pool['available'] > 0 else 0
+                    utilization = pool.allocated / pool.available if pool.available > 0 else 0
                     self.execution_metrics['resource_utilization'][resource_type] = utilization
                 
-                # Check for stuck tasks
-                current_time = time.time()
-                for task_id, task in list(self.active_tasks.items()):
-                    if task.start_time and (current_time - task.start_time) > task.timeout_seconds:
-                        self.logger.warning(f"Task {task_id} has exceeded timeout, marking as failed")
-                        task.status = ExecutionStatus.FAILED
-                        task.error = "Task timeout exceeded"
-                        task.end_time = current_time
-                        await self._release_resources(task)
-                        del self.active_tasks[task_id]
+                self._refresh_status_snapshot()
                 
                 # Log status periodically
                 if len(self.active_tasks) > 0 or len(self.active_workflows) > 0:
@@ -1112,6 +1918,249 @@ class AutonomousExecutionEngine:
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
 
+    async def _timeout_watchdog_loop(self):
+        """Fail active tasks as soon as their deadline passes"""
+        while True:
+            try:
+                self._timeout_event.clear()
+                
+                # Expire every task whose deadline has passed
+                current_time = time.time()
+                expired_tasks = []
+                while self._timeout_heap and self._timeout_heap[0][0] <= current_time:
+                    deadline, task_id = heapq.heappop(self._timeout_heap)
+                    task = self.active_tasks.get(task_id)
+                    
+                    # Ignore entries left behind by finished or restarted tasks
+                    if not task or not task.start_time or task.start_time + task.timeout_seconds != deadline:
+                        continue
+                    
+                    task.status = ExecutionStatus.FAILED
+                    task.error = "Task timeout exceeded"
+                    task.end_time = current_time
+                    expired_tasks.append(task)
+                
+                if expired_tasks:
+                    self.logger.warning(
+                        f"{len(expired_tasks)} task(s) exceeded timeout, stopping: "
+                        f"{', '.join(task.task_id for task in expired_tasks)}"
+                    )
+                    await self._bulk_release_resources(expired_tasks)
+                    for task in expired_tasks:
+                        self._deactivate_task(task)
+                        self._expired_tasks[task.task_id] = task
+                        
+                        # Stop the task's coroutine if it runs behind a workflow handle
+                        workflow_id = self._task_workflows.get(task.task_id)
+                        for handle, handle_task in list(self._workflow_handles.get(workflow_id, {}).items()):
+                            if handle_task is task:
+                                handle.cancel()
+                
+                # Sleep until the next deadline or until a new task starts
+                wait_time = 30
+                if self._timeout_heap:
+                    wait_time = min(wait_time, max(0, self._timeout_heap[0][0] - current_time))
+                
+                # asyncio.wait never converts a cancellation into a timeout, unlike wait_for
+                event_wait = asyncio.ensure_future(self._timeout_event.wait())
+                try:
+                    await asyncio.wait({event_wait}, timeout=wait_time)
+                finally:
+                    event_wait.cancel()
+                
+            except Exception as e:
+                self.logger.error(f"Error in timeout watchdog loop: {e}")
+
+    def _process_monitor_thread(self):
+        """Sample process CPU and memory usage on a dedicated thread"""
+        process = psutil.Process()
+        while not self._monitor_stop.is_set():
+            try:
+                cpu_percent = process.cpu_percent(interval=1)
+                memory_percent = process.memory_percent()
+                
+                with self._metrics_lock:
+                    self.execution_metrics['process_utilization'] = {
+                        'cpu_percent': cpu_percent,
+                        'memory_percent': memory_percent,
+                        'sampled_at': time.time()
+                    }
+                
+            except Exception as e:
+                self.logger.error(f"Error sampling process utilization: {e}")
+            
+            self._monitor_stop.wait(self.process_sample_interval)
+
+    def _load_journal(self):
+        """Replay the journal and keep results of workflows that never finished"""
+        if not MSGPACK_AVAILABLE:
+            self.logger.warning("msgpack not available, crash-recovery journal disabled")
+            return
+        
+        entries = []
+        finished_workflows = set()
+        
+        if os.path.exists(self.journal_file):
+            with open(self.journal_file, 'rb') as f:
+                try:
+                    for entry in msgpack.Unpacker(f, raw=False):
+                        if entry.get('done'):
+                            finished_workflows.add(entry['w'])
+                        else:
+                            entries.append(entry)
+                except Exception as e:
+                    self.logger.warning(f"Stopped reading corrupt journal entry: {e}")
+        
+        # Entries of workflows that were never re-run expire instead of replaying forever
+        cutoff = time.time() - self.journal_recovery_ttl
+        pending = [
+            entry for entry in entries
+            if entry['w'] not in finished_workflows and entry.get('ts', 0) >= cutoff
+        ]
+        self._recovered_results = {}
+        self._journal_entries = defaultdict(list)
+        for entry in pending:
+            self._recovered_results.setdefault(entry['w'], {})[entry['t']] = entry
+            self._journal_entries[entry['w']].append(msgpack.packb(entry, default=str))
+        
+        # Compact the journal down to the still-relevant entries
+        self._journal = self._rewrite_journal(self._journal_entries)
+        self.logger.info(
+            f"Recovered {len(pending)} task results for "
+            f"{len(self._recovered_results)} workflows from journal"
+        )
+
+    def _rewrite_journal(self, entries: Dict[str, List[bytes]], journal=None):
+        """Atomically replace the journal file with the given entries; runs on a worker thread"""
+        temp_file = f"{self.journal_file}.tmp"
+        with open(temp_file, 'wb') as f:
+            for workflow_entries in entries.values():
+                f.writelines(workflow_entries)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.journal_file)
+        
+        # The old handle stays usable until the new file is in place
+        new_journal = open(self.journal_file, 'ab')
+        if journal:
+            journal.close()
+        return new_journal
+
+    @staticmethod
+    def _write_journal(journal, entry: bytes, sync: bool = False):
+        """Append a packed entry to the journal file; runs on a worker thread"""
+        journal.write(entry)
+        journal.flush()
+        if sync:
+            os.fsync(journal.fileno())
+
+    async def _journal_task(self, task: ExecutionTask, fingerprint: str, result: Dict[str, Any]):
+        """Append a completed workflow task to the journal"""
+        try:
+            workflow_id = self._task_workflows.get(task.task_id)
+            if not self._journal or not workflow_id:
+                return
+            
+            entry = msgpack.packb({
+                'w': workflow_id,
+                't': task.task_id,
+                's': task.status.value,
+                'f': fingerprint,
+                'r': result,
+                'ts': time.time()
+            }, default=str)
+            
+            self._journal_entries[workflow_id].append(entry)
+            
+            # Only critical tasks pay for a durable sync
+            async with self._journal_lock:
+                await asyncio.to_thread(
+                    self._write_journal, self._journal, entry,
+                    task.priority == ExecutionPriority.CRITICAL
+                )
+            
+        except Exception as e:
+            self.logger.error(f"Error journaling task {task.task_id}: {e}")
+
+    async def _finish_workflow_journal(self, workflow: ExecutionWorkflow):
+        """Mark a workflow as finished so its journal entries are not replayed"""
+        try:
+            for task in workflow.tasks:
+                self._task_workflows.pop(task.task_id, None)
+                self._rollback_cache.discard(task.task_id)
+            self._recovered_results.pop(workflow.workflow_id, None)
+            self._journal_entries.pop(workflow.workflow_id, None)
+            
+            if self._journal:
+                entry = msgpack.packb({'w': workflow.workflow_id, 'done': True})
+                async with self._journal_lock:
+                    await asyncio.to_thread(self._write_journal, self._journal, entry)
+                    
+                    # Drop finished workflows from the file once it grows past the threshold
+                    if self._journal.tell() >= self.journal_compact_bytes:
+                        self._journal = await asyncio.to_thread(
+                            self._rewrite_journal, dict(self._journal_entries), self._journal
+                        )
+            
+        except Exception as e:
+            self.logger.error(f"Error finishing journal for workflow {workflow.workflow_id}: {e}")
+
+    def _record_completed_workflow(self, workflow: ExecutionWorkflow):
+        """Add a finished workflow to the bounded history"""
+        # Serialize the oldest workflow before the deque evicts it
+        if self.history_file and len(self.completed_workflows) == self.completed_workflows.maxlen:
+            self._pending_history.append(self._workflow_record(self.completed_workflows[0]))
+        
+        self.completed_workflows.append(workflow)
+
+    def _workflow_record(self, workflow: ExecutionWorkflow) -> Dict[str, Any]:
+        """Build a compact history record, leaving out parameters, results and rollback data"""
+        return {
+            'workflow_id': workflow.workflow_id,
+            'name': workflow.name,
+            'status': workflow.status.value,
+            'start_time': workflow.start_time,
+            'end_time': workflow.end_time,
+            'tasks': [
+                {
+                    'task_id': task.task_id,
+                    'status': task.status.value,
+                    'start_time': task.start_time,
+                    'end_time': task.end_time
+                }
+                for task in workflow.tasks
+            ]
+        }
+
+    async def _flush_history_loop(self):
+        """Periodically append completed workflow records to the history file"""
+        while True:
+            try:
+                await asyncio.sleep(self.history_flush_interval)
+                await self._flush_history()
+                
+            except Exception as e:
+                self.logger.error(f"Error in history flush loop: {e}")
+
+    async def _flush_history(self, include_retained: bool = False):
+        """Write evicted (and optionally still-retained) workflow records as JSON lines"""
+        if not self.history_file:
+            return
+        
+        records = []
+        while self._pending_history:
+            records.append(self._pending_history.popleft())
+        
+        if include_retained:
+            records.extend(self._workflow_record(workflow) for workflow in self.completed_workflows)
+        
+        if not records:
+            return
+        
+        lines = ''.join(_json_dumps(record) + '\n' for record in records)
+        await self._write_file(self.history_file, lines, 'a')
+        self.logger.info(f"Flushed {len(records)} workflow records to {self.history_file}")
+
     def _update_execution_metrics(self, workflow: ExecutionWorkflow, result: Dict[str, Any]):
         """Update execution metrics after workflow completion"""
         try:
@@ -1123,7 +2172,8 @@ class AutonomousExecutionEngine:
                     'total_workflows': 0,
                     'successful_workflows': 0,
                     'failed_workflows': 0,
-                    'average_workflow_time': 0.0
+                    'average_workflow_time': 0.0,
+                    'workflow_time_stddev': 0.0
                 }
             
             metrics = self.execution_metrics['workflow_metrics']
@@ -1134,33 +2184,66 @@ class AutonomousExecutionEngine:
             else:
                 metrics['failed_workflows'] += 1
             
-            # Update average workflow time
-            metrics['average_workflow_time'] = (
-                (metrics['average_workflow_time'] * (metrics['total_workflows'] - 1) + execution_time) /
-                metrics['total_workflows']
+            # Welford's online mean/variance of workflow time
+            count = metrics['total_workflows']
+            previous_mean = metrics['average_workflow_time']
+            mean = previous_mean + (execution_time - previous_mean) / count
+            self._workflow_time_m2 += (execution_time - previous_mean) * (execution_time - mean)
+            metrics['average_workflow_time'] = mean
+            metrics['workflow_time_stddev'] = (
+                (self._workflow_time_m2 / (count - 1)) ** 0.5 if count > 1 else 0.0
             )
             
         except Exception as e:
             self.logger.error(f"Error updating execution metrics: {e}")
 
-    async def get_execution_status(self) -> Dict[str, Any]:
-        """Get current execution engine status"""
+    async def get_execution_status(self, fresh: bool = False) -> Dict[str, Any]:
+        """Get execution engine status from the last snapshot, or recomputed if fresh"""
         try:
-            return {
-                'active_workflows': len(self.active_workflows),
-                'active_tasks': len(self.active_tasks),
-                'completed_workflows': len(self.completed_workflows),
-                'resource_pools': self.resource_pools.copy(),
-                'execution_metrics': self.execution_metrics.copy(),
-                'github_client_available': self.github_client is not None,
-                'http_session_available': self.http_session is not None,
-                'api_keys_loaded': len(self.api_keys)
-            }
+            if fresh or self._status_snapshot is None:
+                status = self._build_execution_status()
+                self._status_snapshot = _json_dumps(status)
+                return status
+            
+            return _json_loads(self._status_snapshot)
             
         except Exception as e:
             self.logger.error(f"Error getting execution status: {e}")
             return {'error': str(e)}
 
+    def get_status_snapshot(self) -> str:
+        """Get the last execution status as serialized JSON"""
+        if self._status_snapshot is None:
+            self._refresh_status_snapshot()
+        return self._status_snapshot
+
+    def _refresh_status_snapshot(self):
+        """Re-serialize the execution status snapshot"""
+        try:
+            self._status_snapshot = _json_dumps(self._build_execution_status())
+            
+        except Exception as e:
+            self.logger.error(f"Error refreshing status snapshot: {e}")
+
+    def _build_execution_status(self) -> Dict[str, Any]:
+        """Collect the current execution engine status"""
+        with self._metrics_lock:
+            execution_metrics = self.execution_metrics.copy()
+        
+        return {
+            'active_workflows': len(self.active_workflows),
+            'active_tasks': len(self.active_tasks),
+            'completed_workflows': len(self.completed_workflows),
+            'resource_pools': {
+                resource_type: pool.to_dict()
+                for resource_type, pool in self.resource_pools.items()
+            },
+            'execution_metrics': execution_metrics,
+            'github_client_available': self.github_client is not None,
+            'http_session_available': self.http_session is not None,
+            'api_keys_loaded': len(self.api_keys)
+        }
+
     async def pause_workflow(self, workflow_id: str) -> bool:
         """Pause a running workflow"""
         try:
@@ -1194,22 +2277,26 @@ class AutonomousExecutionEngine:
         """Cancel a running workflow"""
         try:
             if workflow_id in self.active_workflows:
-                workflow = self.active_workflows[workflow_id]
+                # Deactivate first so executors treat the cancellation as a workflow cancel
+                workflow = self.active_workflows.pop(workflow_id)
                 workflow.status = ExecutionStatus.FAILED
                 workflow.end_time = time.time()
                 
+                # Cancel the workflow's running task handles
+                for handle in self._workflow_handles.get(workflow_id, ()):
+                    handle.cancel()
+                
                 # Cancel active tasks in this workflow
-                for task in workflow.tasks:
-                    if task.task_id in self.active_tasks:
+                for task_id in self._workflow_active_tasks.pop(workflow_id, ()):
+                    task = self.active_tasks.pop(task_id, None)
+                    if task:
                         task.status = ExecutionStatus.FAILED
                         task.error = "Workflow cancelled"
                         task.end_time = time.time()
                         await self._release_resources(task)
-                        del self.active_tasks[task.task_id]
                 
                 # Move to completed workflows
-                self.completed_workflows.append(workflow)
-                del self.active_workflows[workflow_id]
+                self._record_completed_workflow(workflow)
                 
                 self.logger.info(f"Workflow {workflow_id} cancelled")
                 return True
@@ -1222,9 +2309,25 @@ class AutonomousExecutionEngine:
     async def cleanup(self):
         """Cleanup resources and connections"""
         try:
+            self._monitor_stop.set()
+            
+            if self._timeout_watchdog_task:
+                self._timeout_watchdog_task.cancel()
+                try:
+                    await self._timeout_watchdog_task
+                except asyncio.CancelledError:
+                    pass
+                self._timeout_watchdog_task = None
+            
+            await self._flush_history(include_retained=True)
+            
             if self.http_session:
                 await self.http_session.close()
             
+            if self._journal:
+                journal, self._journal = self._journal, None
+                await asyncio.to_thread(journal.close)
+            
             self.logger.info("Execution engine cleanup completed")
             
         except Exception as e:
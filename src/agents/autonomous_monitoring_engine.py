@@ -16,23 +16,33 @@ Key Features:
 
 import logging
 import asyncio
-import json
+import sys
 import time
+import random
 import numpy as np
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-import statistics
-import hashlib
-import os
 from collections import deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from types import MappingProxyType
 
 # Machine learning for anomaly detection
+from sklearn.base import clone
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import DBSCAN
-import pandas as pd
+
+from src.utils.dataclass_slots import add_slots
+
+# Multi-threaded C++ isolation forest (falls back to scikit-learn's when unavailable)
+try:
+    from isotree import IsolationForest as IsoTreeIsolationForest
+    ISOTREE_AVAILABLE = True
+except ImportError:
+    ISOTREE_AVAILABLE = False
 
 class HealthStatus(Enum):
     """System health status levels"""
@@ -59,19 +69,21 @@ class RecoveryAction(Enum):
     CLEAR_CACHE = "clear_cache"
     REPAIR_DATA = "repair_data"
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class MetricData:
     """Represents a metric data point"""
     name: str
     value: float
     timestamp: float
-    tags: Dict[str, str] = field(default_factory=dict)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    tags: Optional[Dict[str, str]] = None
+    metadata: Optional[Dict[str, Any]] = None
 
+@add_slots
 @dataclass
 class Alert:
     """Represents a system alert"""
-    alert_id: str
+    alert_id: Tuple[str, str, int]  # (kind, metric name, creation second)
     severity: AlertSeverity
     title: str
     description: str
@@ -83,6 +95,11 @@ class Alert:
     resolution_time: Optional[float] = None
     recovery_actions: List[str] = field(default_factory=list)
 
+def format_alert_id(alert_id: Tuple[str, str, int]) -> str:
+    """Render an alert id as its display string, e.g. health_cpu_usage_1700000000"""
+    return "_".join(map(str, alert_id))
+
+@add_slots
 @dataclass
 class HealthCheck:
     """Represents a health check configuration"""
@@ -93,9 +110,10 @@ class HealthCheck:
     failure_threshold: int
     recovery_actions: List[RecoveryAction]
     enabled: bool = True
-    last_check_time: float = 0
+    last_check_time: float = float('-inf')  # time.monotonic() of the last run
     consecutive_failures: int = 0
 
+@add_slots
 @dataclass
 class PerformanceBaseline:
     """Represents performance baseline for a metric"""
@@ -107,6 +125,138 @@ class PerformanceBaseline:
     last_updated: float
     sample_count: int
 
+@add_slots
+@dataclass
+class RollingWindow:
+    """Most recent points of a metric with a running sum of their values"""
+    points: deque
+    total: float = 0.0
+    
+    def add(self, metric: MetricData):
+        """Append a point, evicting the oldest once the window is full"""
+        if len(self.points) == self.points.maxlen:
+            self.total -= self.points[0].value
+        self.points.append(metric)
+        self.total += metric.value
+    
+    def expire(self, cutoff_time: float):
+        """Drop points older than cutoff_time and resync the running sum"""
+        while self.points and self.points[0].timestamp < cutoff_time:
+            self.points.popleft()
+        self.total = sum(m.value for m in self.points)
+    
+    def mean(self) -> float:
+        """Average value of the points in the window"""
+        return self.total / len(self.points)
+
+class MetricSeries:
+    """Fixed-capacity ring of one metric's samples stored in parallel numpy arrays"""
+    
+    __slots__ = ('timestamps', 'values', 'start', 'size', 'appended')
+    
+    def __init__(self, capacity: int):
+        self.timestamps = np.empty(capacity, dtype=np.float64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.start = 0  # Slot of the oldest sample
+        self.size = 0
+        self.appended = 0  # Samples ever appended, to tell when the series has advanced
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, timestamp: float, value: float):
+        """Append a sample, overwriting the oldest once the ring is full"""
+        capacity = len(self.values)
+        end = (self.start + self.size) % capacity
+        self.timestamps[end] = timestamp
+        self.values[end] = value
+        if self.size < capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % capacity
+        self.appended += 1
+    
+    def tail(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Copy the timestamps and values of the last count samples, oldest first"""
+        count = min(count, self.size)
+        indices = np.arange(self.start + self.size - count, self.start + self.size)
+        return (
+            self.timestamps.take(indices, mode='wrap'),
+            self.values.take(indices, mode='wrap')
+        )
+    
+    def latest_value(self) -> float:
+        """Value of the most recent sample"""
+        return float(self.values[(self.start + self.size - 1) % len(self.values)])
+    
+    def expire(self, cutoff_time: float):
+        """Drop samples older than cutoff_time"""
+        timestamps, _ = self.tail(self.size)
+        expired = int(np.searchsorted(timestamps, cutoff_time))
+        self.start = (self.start + expired) % len(self.values)
+        self.size -= expired
+
+@add_slots
+@dataclass
+class MetricAggregate:
+    """Count, sum, min and max of a metric over one time bucket"""
+    start: float
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    
+    def mean(self) -> float:
+        """Average value over the bucket"""
+        return self.total / self.count
+
+class MetricHistory:
+    """Downsampled history of a metric at progressively coarser resolutions"""
+    
+    __slots__ = ('tiers', 'open_buckets')
+    
+    # (bucket seconds, buckets kept): 1 minute for an hour, 5 minutes for a day, 1 hour for a week
+    TIERS = ((60, 60), (300, 288), (3600, 168))
+    
+    def __init__(self):
+        self.tiers = [deque(maxlen=kept) for _, kept in self.TIERS]
+        self.open_buckets = [None] * len(self.TIERS)
+    
+    def add(self, timestamp: float, value: float):
+        """Fold a sample into the finest tier"""
+        self._merge(0, timestamp, 1, value, value, value)
+    
+    def _merge(self, level: int, timestamp: float, count: int, total: float,
+               minimum: float, maximum: float):
+        """Fold an aggregate into a tier, rolling its closed bucket into the next tier"""
+        bucket_seconds = self.TIERS[level][0]
+        start = timestamp - timestamp % bucket_seconds
+        current = self.open_buckets[level]
+        
+        if current is not None and current.start == start:
+            current.count += count
+            current.total += total
+            current.minimum = min(current.minimum, minimum)
+            current.maximum = max(current.maximum, maximum)
+            return
+        
+        if current is not None:
+            self.tiers[level].append(current)
+            if level + 1 < len(self.TIERS):
+                self._merge(level + 1, current.start, current.count, current.total,
+                            current.minimum, current.maximum)
+        
+        self.open_buckets[level] = MetricAggregate(start, count, total, minimum, maximum)
+    
+    def buckets(self, level: int) -> List[MetricAggregate]:
+        """Buckets covering every sample in a tier's span, oldest first"""
+        buckets = list(self.tiers[level])
+        # Samples in the finer tiers' open buckets haven't been rolled up into this tier yet
+        for finer_level in range(level, -1, -1):
+            if self.open_buckets[finer_level] is not None:
+                buckets.append(self.open_buckets[finer_level])
+        return buckets
+
 class AutonomousMonitoringEngine:
     """
     Advanced autonomous monitoring and self-healing engine
@@ -127,24 +277,69 @@ class AutonomousMonitoringEngine:
         # Monitoring state
         self.is_monitoring = False
         self.metrics_buffer = deque(maxlen=10000)  # Store recent metrics
-        self.alerts = {}  # Active alerts
-        self.alert_history = deque(maxlen=1000)
+        self.metric_series_length = config.get('metric_series_length', 2000)
+        self.metrics_by_name = defaultdict(lambda: MetricSeries(self.metric_series_length))
+        # Running means over the windows the health checks average, updated on record
+        self.rolling_windows = {
+            'cpu_usage_percent': RollingWindow(deque(maxlen=20)),
+            'memory_usage_percent': RollingWindow(deque(maxlen=20)),
+            'mining_hashrate': RollingWindow(deque(maxlen=10))
+        }
+        self.alerts = {}  # Alerts by (kind, metric name, second) id, in creation order
+        self._unresolved_alerts = {}  # Unresolved alerts by id, in creation order
+        self._critical_unresolved = set()  # Ids of unresolved critical alerts
+        self._unresolved_alerts_by_metric = defaultdict(set)  # metric_name -> unresolved alert ids
+        self.alert_history = deque(maxlen=config.get('alert_history_size', 1000))
         
         # Health checks
         self.health_checks = {}
+        self._enabled_checks = {}  # Enabled health checks by name
+        self._health_status_counts = {'healthy': 0, 'warning': 0, 'critical': 0}  # Enabled checks per bucket
+        self.health_check_budget_seconds = config.get('health_check_budget_seconds', 30)
+        self.health_check_concurrency = config.get('health_check_concurrency', 8)
+        self._check_semaphore = None  # Caps concurrent checks while monitoring runs
         self.health_status = HealthStatus.GOOD
         self.overall_health_score = 0.8
         
         # Performance baselines and anomaly detection
         self.performance_baselines = {}
+        self.metric_history = defaultdict(MetricHistory)  # Tiered aggregates kept past retention
+        self.performance_trends = {}
         self.anomaly_detector = None
+        self.anomaly_contamination = 0.1  # Expected share of anomalous values
         self.scaler = StandardScaler()
+        self._anomaly_models = {}  # Per-metric (detector, scaler, score threshold), refit by the learning loop
+        self._anomaly_checked_counts = {}  # Series append count at the last analysis per metric
+        self._last_anomaly_buffer_tail = None
+        
+        # Worker threads shared by blocking monitoring work while monitoring runs
+        self.executor_workers = config.get('executor_workers', 8)
+        self._executor = None
+        
+        # Random generator for simulated metrics, drawn in batches per cycle
+        self._rng = np.random.default_rng()
+        # Stdlib generator for the one-off scalar draws of simulated checks and actions
+        self._sim_rng = random.Random(config.get('simulation_seed'))
         
         # Self-healing and recovery
         self.recovery_actions = {}
-        self.recovery_history = deque(maxlen=500)
+        self._recovery_plans = {}  # Health check name -> [(action name, handler)], in order
+        self._recovery_times = RollingWindow(deque(maxlen=50))  # Alert-to-resolution times of recoveries
+        self.recovery_history = deque(maxlen=config.get('recovery_history_size', 500))
         self.auto_healing_enabled = True
         
+        # Simulated recovery action durations (seconds), skipped when simulate_io is off
+        self.simulate_io = config.get('simulate_io', True)
+        self.simulation_delays = {
+            RecoveryAction.RESTART_SERVICE: 2,
+            RecoveryAction.SCALE_RESOURCES: 3,
+            RecoveryAction.ROLLBACK_CHANGES: 5,
+            RecoveryAction.FAILOVER: 10,
+            RecoveryAction.OPTIMIZE_CONFIGURATION: 3,
+            RecoveryAction.CLEAR_CACHE: 1,
+            RecoveryAction.REPAIR_DATA: 15
+        }
+        
         # Learning and adaptation
         self.learning_enabled = True
         self.adaptation_rate = 0.1
@@ -165,6 +360,7 @@ class AutonomousMonitoringEngine:
             'mean_time_to_detection': 0.0,
             'mean_time_to_recovery': 0.0
         }
+        self._performance_metrics_view = MappingProxyType(self.performance_metrics)  # Read-only, live
         
         # Initialize components
         self._initialize_health_checks()
@@ -256,10 +452,15 @@ class AutonomousMonitoringEngine:
                 recovery_actions=[RecoveryAction.RESTART_SERVICE, RecoveryAction.FAILOVER]
             )
             
-            self.logger.info(f"Initialized {len(self.health_checks)} health checks")
+            for health_check in self.health_checks.values():
+                if health_check.enabled:
+                    self._enabled_checks[health_check.name] = health_check
+                    self._health_status_counts[self._health_bucket(health_check)] += 1
+            
+            self.logger.info("Initialized %s health checks", len(self.health_checks))
             
         except Exception as e:
-            self.logger.error(f"Error initializing health checks: {e}")
+            self.logger.error("Error initializing health checks: %s", e)
 
     def _initialize_recovery_actions(self):
         """Initialize recovery action handlers"""
@@ -274,25 +475,44 @@ class AutonomousMonitoringEngine:
                 RecoveryAction.REPAIR_DATA: self._repair_data
             }
             
-            self.logger.info(f"Initialized {len(self.recovery_actions)} recovery actions")
+            # Resolve each check's recovery actions to handlers once, up front
+            self._recovery_plans = {
+                name: [
+                    (action.value, self.recovery_actions[action])
+                    for action in health_check.recovery_actions
+                    if action in self.recovery_actions
+                ]
+                for name, health_check in self.health_checks.items()
+            }
+            
+            self.logger.info("Initialized %s recovery actions", len(self.recovery_actions))
             
         except Exception as e:
-            self.logger.error(f"Error initializing recovery actions: {e}")
+            self.logger.error("Error initializing recovery actions: %s", e)
 
     def _initialize_anomaly_detection(self):
         """Initialize anomaly detection models"""
         try:
             # Initialize Isolation Forest for anomaly detection
-            self.anomaly_detector = IsolationForest(
-                contamination=0.1,  # Expect 10% anomalies
-                random_state=42,
-                n_estimators=100
-            )
+            if ISOTREE_AVAILABLE:
+                self.anomaly_detector = IsoTreeIsolationForest(
+                    sample_size=256,
+                    ntrees=100,
+                    ndim=1,
+                    nthreads=-1,
+                    random_seed=42
+                )
+            else:
+                self.anomaly_detector = IsolationForest(
+                    contamination=self.anomaly_contamination,
+                    random_state=42,
+                    n_estimators=100
+                )
             
             self.logger.info("Anomaly detection models initialized")
             
         except Exception as e:
-            self.logger.error(f"Error initializing anomaly detection: {e}")
+            self.logger.error("Error initializing anomaly detection: %s", e)
 
     async def start_monitoring(self):
         """Start the autonomous monitoring system"""
@@ -304,6 +524,12 @@ class AutonomousMonitoringEngine:
             self.is_monitoring = True
             self.logger.info("🔍 Starting autonomous monitoring system...")
             
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.executor_workers, thread_name_prefix='monitor'
+                )
+            self._check_semaphore = asyncio.Semaphore(self.health_check_concurrency)
+            
             # Start monitoring loops
             monitoring_tasks = [
                 asyncio.create_task(self._health_check_loop()),
@@ -319,17 +545,23 @@ class AutonomousMonitoringEngine:
             await asyncio.gather(*monitoring_tasks, return_exceptions=True)
             
         except Exception as e:
-            self.logger.error(f"Error starting monitoring: {e}")
+            self.logger.error("Error starting monitoring: %s", e)
             self.is_monitoring = False
 
     async def stop_monitoring(self):
         """Stop the autonomous monitoring system"""
         try:
             self.is_monitoring = False
+            
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            self._check_semaphore = None
+            
             self.logger.info("🛑 Autonomous monitoring system stopped")
             
         except Exception as e:
-            self.logger.error(f"Error stopping monitoring: {e}")
+            self.logger.error("Error stopping monitoring: %s", e)
 
     async def _health_check_loop(self):
         """Main health check monitoring loop"""
@@ -337,15 +569,14 @@ class AutonomousMonitoringEngine:
         
         while self.is_monitoring:
             try:
-                current_time = time.time()
+                current_time = time.monotonic()
                 
-                for check_name, health_check in self.health_checks.items():
-                    if not health_check.enabled:
-                        continue
-                    
-                    # Check if it's time to run this health check
-                    if (current_time - health_check.last_check_time) >= health_check.interval_seconds:
-                        await self._execute_health_check(health_check)
+                # Run every due health check concurrently so slow checks don't delay the rest
+                due_checks = [
+                    health_check for health_check in self._enabled_checks.values()
+                    if (current_time - health_check.last_check_time) >= health_check.interval_seconds
+                ]
+                await self._run_health_checks(due_checks)
                 
                 # Update overall health status
                 await self._update_overall_health()
@@ -353,50 +584,101 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(10)  # Check every 10 seconds
                 
             except Exception as e:
-                self.logger.error(f"Error in health check loop: {e}")
+                self.logger.error("Error in health check loop: %s", e)
                 await asyncio.sleep(30)
 
-    async def _execute_health_check(self, health_check: HealthCheck):
-        """Execute a single health check"""
+    async def _run_health_checks(self, health_checks: List[HealthCheck]):
+        """Run health checks concurrently within their own timeouts and one global budget"""
+        started = time.monotonic()
+        pending = {}
+        for health_check in health_checks:
+            health_check.last_check_time = started
+            pending[asyncio.ensure_future(self._run_check_function(health_check))] = health_check
+        
+        # Each check enforces its own timeout; only the global budget is enforced here
         try:
-            health_check.last_check_time = time.time()
-            
-            # Execute the health check function with timeout
+            if pending:
+                await asyncio.wait(set(pending), timeout=self.health_check_budget_seconds)
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        # Collect every outcome first; a task is None when its check timed out
+        outcomes = []
+        for task, health_check in pending.items():
+            if (not task.done() or task.cancelled()
+                    or isinstance(task.exception(), asyncio.TimeoutError)):
+                outcomes.append((health_check, None))
+            else:
+                outcomes.append((health_check, task))
+        
+        # Alert and recovery handling can take seconds, so it only runs once no check is waiting
+        wall_time = time.time()  # Shared by the alerts raised for this batch
+        for health_check, task in outcomes:
+            if task is None:
+                await self._handle_health_check_timeout(health_check, wall_time)
+                continue
             try:
-                result = await asyncio.wait_for(
-                    health_check.check_function(),
-                    timeout=health_check.timeout_seconds
-                )
-                
-                if result['healthy']:
-                    health_check.consecutive_failures = 0
-                    
-                    # Resolve any existing alerts for this check
-                    await self._resolve_alerts_for_check(health_check.name)
-                    
-                else:
-                    health_check.consecutive_failures += 1
-                    
-                    # Create alert if failure threshold reached
-                    if health_check.consecutive_failures >= health_check.failure_threshold:
-                        await self._create_health_alert(health_check, result)
-                
-                # Record metric
-                await self._record_metric(
-                    f"health_check_{health_check.name}",
-                    1.0 if result['healthy'] else 0.0,
-                    {'check_name': health_check.name}
-                )
-                
-            except asyncio.TimeoutError:
-                health_check.consecutive_failures += 1
-                self.logger.warning(f"Health check {health_check.name} timed out")
-                
-                if health_check.consecutive_failures >= health_check.failure_threshold:
-                    await self._create_timeout_alert(health_check)
-            
-        except Exception as e:
-            self.logger.error(f"Error executing health check {health_check.name}: {e}")
+                await self._process_health_check_result(health_check, task.result(), wall_time)
+            except Exception as e:
+                self.logger.error("Error executing health check %s: %s", health_check.name, e)
+
+    async def _run_check_function(self, health_check: HealthCheck) -> Dict[str, Any]:
+        """Run a check function, waiting for a concurrency slot while monitoring runs"""
+        if self._check_semaphore is None:
+            return await asyncio.wait_for(health_check.check_function(), health_check.timeout_seconds)
+        async with self._check_semaphore:
+            # The check's timeout starts once it holds a slot, not while it queues
+            return await asyncio.wait_for(health_check.check_function(), health_check.timeout_seconds)
+
+    @staticmethod
+    def _health_bucket(health_check: HealthCheck) -> str:
+        """Classify a health check as healthy, warning or critical by its failure streak"""
+        if health_check.consecutive_failures == 0:
+            return 'healthy'
+        if health_check.consecutive_failures < health_check.failure_threshold:
+            return 'warning'
+        return 'critical'
+
+    def _set_consecutive_failures(self, health_check: HealthCheck, failures: int):
+        """Update a check's failure streak and the status counts when its bucket changes"""
+        previous_bucket = self._health_bucket(health_check)
+        health_check.consecutive_failures = failures
+        bucket = self._health_bucket(health_check)
+        if bucket != previous_bucket and health_check.enabled:
+            self._health_status_counts[previous_bucket] -= 1
+            self._health_status_counts[bucket] += 1
+
+    async def _process_health_check_result(self, health_check: HealthCheck, result: Dict[str, Any],
+                                           now: Optional[float] = None):
+        """Apply the result of a completed health check"""
+        if result['healthy']:
+            self._set_consecutive_failures(health_check, 0)
+            
+            # Resolve any existing alerts for this check
+            await self._resolve_alerts_for_check(health_check.name, now)
+            
+        else:
+            self._set_consecutive_failures(health_check, health_check.consecutive_failures + 1)
+            
+            # Create alert if failure threshold reached
+            if health_check.consecutive_failures >= health_check.failure_threshold:
+                await self._create_health_alert(health_check, result, now)
+        
+        # Record metric
+        await self._record_metric(
+            f"health_check_{health_check.name}",
+            1.0 if result['healthy'] else 0.0,
+            {'check_name': health_check.name}
+        )
+
+    async def _handle_health_check_timeout(self, health_check: HealthCheck, now: Optional[float] = None):
+        """Count a timed out health check as a failure"""
+        self._set_consecutive_failures(health_check, health_check.consecutive_failures + 1)
+        self.logger.warning("Health check %s timed out", health_check.name)
+        
+        if health_check.consecutive_failures >= health_check.failure_threshold:
+            await self._create_timeout_alert(health_check, now)
 
     async def _metric_collection_loop(self):
         """Collect system and application metrics"""
@@ -416,83 +698,107 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(self.monitoring_interval)
                 
             except Exception as e:
-                self.logger.error(f"Error in metric collection loop: {e}")
+                self.logger.error("Error in metric collection loop: %s", e)
                 await asyncio.sleep(60)
 
     async def _collect_system_metrics(self):
         """Collect system-level metrics"""
         try:
-            current_time = time.time()
-            
-            # CPU usage (simulated - in production would use psutil)
-            cpu_usage = np.random.normal(50, 15)  # Simulate CPU usage
-            await self._record_metric('cpu_usage_percent', max(0, min(100, cpu_usage)))
-            
-            # Memory usage (simulated)
-            memory_usage = np.random.normal(60, 20)
-            await self._record_metric('memory_usage_percent', max(0, min(100, memory_usage)))
-            
-            # Disk usage (simulated)
-            disk_usage = np.random.normal(40, 10)
-            await self._record_metric('disk_usage_percent', max(0, min(100, disk_usage)))
-            
-            # Network metrics (simulated)
-            network_in = np.random.exponential(1000)  # KB/s
-            network_out = np.random.exponential(500)
-            await self._record_metric('network_in_kbps', network_in)
-            await self._record_metric('network_out_kbps', network_out)
+            # CPU, memory and disk usage (simulated - in production would use psutil)
+            cpu_usage, memory_usage, disk_usage = np.clip(
+                self._rng.normal([50, 60, 40], [15, 20, 10]), 0, 100
+            ).tolist()
+            
+            # Network metrics in KB/s (simulated)
+            network_in, network_out = self._rng.exponential([1000, 500]).tolist()
+            
+            await self._record_metrics([
+                ('cpu_usage_percent', cpu_usage),
+                ('memory_usage_percent', memory_usage),
+                ('disk_usage_percent', disk_usage),
+                ('network_in_kbps', network_in),
+                ('network_out_kbps', network_out)
+            ])
             
         except Exception as e:
-            self.logger.error(f"Error collecting system metrics: {e}")
+            self.logger.error("Error collecting system metrics: %s", e)
 
     async def _collect_application_metrics(self):
         """Collect application-specific metrics"""
         try:
-            # Mining metrics (simulated)
-            hashrate = np.random.normal(5000, 500)  # H/s
-            await self._record_metric('mining_hashrate', max(0, hashrate))
-            
-            pending_balance = np.random.exponential(0.05)  # XMR
-            await self._record_metric('mining_pending_balance', pending_balance)
-            
-            # Treasury metrics (simulated)
-            treasury_value = np.random.normal(150000, 10000)  # USD
-            await self._record_metric('treasury_total_value_usd', max(0, treasury_value))
-            
-            portfolio_diversity = np.random.uniform(0.6, 0.9)
-            await self._record_metric('treasury_diversity_score', portfolio_diversity)
-            
-            # Governance metrics (simulated)
-            participation_rate = np.random.uniform(0.7, 0.95)
-            await self._record_metric('governance_participation_rate', participation_rate)
-            
-            proposal_success_rate = np.random.uniform(0.8, 0.95)
-            await self._record_metric('governance_proposal_success_rate', proposal_success_rate)
-            
-            # Decision engine metrics
-            decision_accuracy = np.random.uniform(0.8, 0.95)
-            await self._record_metric('decision_engine_accuracy', decision_accuracy)
-            
-            execution_success_rate = np.random.uniform(0.85, 0.98)
-            await self._record_metric('execution_engine_success_rate', execution_success_rate)
+            # Mining hashrate in H/s and treasury value in USD (simulated)
+            hashrate, treasury_value = np.maximum(
+                self._rng.normal([5000, 150000], [500, 10000]), 0
+            ).tolist()
+            
+            pending_balance = float(self._rng.exponential(0.05))  # XMR
+            
+            # Treasury diversity, governance and engine rates (simulated)
+            (portfolio_diversity, participation_rate, proposal_success_rate,
+             decision_accuracy, execution_success_rate) = self._rng.uniform(
+                [0.6, 0.7, 0.8, 0.8, 0.85], [0.9, 0.95, 0.95, 0.95, 0.98]
+            ).tolist()
+            
+            await self._record_metrics([
+                ('mining_hashrate', hashrate),
+                ('mining_pending_balance', pending_balance),
+                ('treasury_total_value_usd', treasury_value),
+                ('treasury_diversity_score', portfolio_diversity),
+                ('governance_participation_rate', participation_rate),
+                ('governance_proposal_success_rate', proposal_success_rate),
+                ('decision_engine_accuracy', decision_accuracy),
+                ('execution_engine_success_rate', execution_success_rate)
+            ])
             
         except Exception as e:
-            self.logger.error(f"Error collecting application metrics: {e}")
+            self.logger.error("Error collecting application metrics: %s", e)
 
     async def _record_metric(self, name: str, value: float, tags: Dict[str, str] = None):
         """Record a metric data point"""
         try:
+            # Share one string per metric name so buffered points and index lookups reuse it
+            name = sys.intern(name)
             metric = MetricData(
                 name=name,
                 value=value,
                 timestamp=time.time(),
-                tags=tags or {}
+                tags=tags
             )
             
             self.metrics_buffer.append(metric)
+            self.metrics_by_name[name].append(metric.timestamp, value)
+            self.metric_history[name].add(metric.timestamp, value)
+            window = self.rolling_windows.get(name)
+            if window is not None:
+                window.add(metric)
+            
+        except Exception as e:
+            self.logger.error("Error recording metric %s: %s", name, e)
+
+    async def _record_metrics(self, samples: List[Tuple[str, float]]):
+        """Record a batch of metric data points sharing one timestamp"""
+        try:
+            timestamp = time.time()
+            metrics = [MetricData(name, value, timestamp) for name, value in samples]
+            
+            self.metrics_buffer.extend(metrics)
+            metrics_by_name = self.metrics_by_name
+            metric_history = self.metric_history
+            rolling_windows = self.rolling_windows
+            for metric in metrics:
+                metrics_by_name[metric.name].append(timestamp, metric.value)
+                metric_history[metric.name].add(timestamp, metric.value)
+                window = rolling_windows.get(metric.name)
+                if window is not None:
+                    window.add(metric)
             
         except Exception as e:
-            self.logger.error(f"Error recording metric {name}: {e}")
+            self.logger.error("Error recording metrics: %s", e)
+
+    def _latest_value(self, name: str) -> Optional[float]:
+        """Get the most recent value recorded for a metric"""
+        series = self.metrics_by_name.get(name)
+        return series.latest_value() if series else None
 
     async def _anomaly_detection_loop(self):
         """Detect anomalies in metric data"""
@@ -506,64 +812,96 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(120)  # Run every 2 minutes
                 
             except Exception as e:
-                self.logger.error(f"Error in anomaly detection loop: {e}")
+                self.logger.error("Error in anomaly detection loop: %s", e)
                 await asyncio.sleep(300)
 
     async def _detect_anomalies(self):
         """Detect anomalies in recent metric data"""
         try:
-            # Group metrics by name
-            metric_groups = defaultdict(list)
-            
-            for metric in list(self.metrics_buffer)[-self.anomaly_detection_window:]:
-                metric_groups[metric.name].append(metric)
+            # Nothing new has been recorded since the last run
+            buffer_tail = self.metrics_buffer[-1] if self.metrics_buffer else None
+            if buffer_tail is self._last_anomaly_buffer_tail:
+                return
+            self._last_anomaly_buffer_tail = buffer_tail
             
-            # Analyze each metric group for anomalies
-            for metric_name, metrics in metric_groups.items():
-                if len(metrics) < 20:  # Need sufficient data points
+            # Analyze the recent window of each metric series that has advanced
+            for metric_name in list(self.metrics_by_name):
+                series = self.metrics_by_name[metric_name]
+                if len(series) < 20:  # Need sufficient data points
                     continue
+                if series.appended == self._anomaly_checked_counts.get(metric_name):
+                    continue
+                self._anomaly_checked_counts[metric_name] = series.appended
                 
-                await self._analyze_metric_anomalies(metric_name, metrics)
+                timestamps, values = series.tail(self.anomaly_detection_window)
+                await self._analyze_metric_anomalies(metric_name, timestamps, values)
                 
         except Exception as e:
-            self.logger.error(f"Error detecting anomalies: {e}")
+            self.logger.error("Error detecting anomalies: %s", e)
 
-    async def _analyze_metric_anomalies(self, metric_name: str, metrics: List[MetricData]):
+    async def _analyze_metric_anomalies(self, metric_name: str, timestamps: np.ndarray,
+                                        values: np.ndarray):
         """Analyze a specific metric for anomalies"""
         try:
-            values = np.array([m.value for m in metrics]).reshape(-1, 1)
-            timestamps = [m.timestamp for m in metrics]
-            
-            # Fit anomaly detector if we have enough data
+            # Score recent values once we have enough data
             if len(values) >= 50:
-                # Use recent data to fit the model
-                recent_values = values[-50:]
-                scaled_values = self.scaler.fit_transform(recent_values)
+                loop = asyncio.get_running_loop()
                 
-                # Detect anomalies
-                anomaly_scores = self.anomaly_detector.fit_predict(scaled_values)
+                # Models are refit periodically; only fit here for a metric seen for the first time
+                model = self._anomaly_models.get(metric_name)
+                if model is None:
+                    model = await loop.run_in_executor(
+                        self._executor, self._fit_anomaly_model, values.reshape(-1, 1)
+                    )
+                    self._anomaly_models[metric_name] = model
                 
                 # Check the most recent values for anomalies
-                recent_anomalies = anomaly_scores[-10:]  # Last 10 values
+                recent_anomalies = await loop.run_in_executor(
+                    self._executor, self._predict_anomalies, model, values[-10:].reshape(-1, 1)
+                )
                 
                 if np.any(recent_anomalies == -1):  # -1 indicates anomaly
                     anomaly_indices = np.where(recent_anomalies == -1)[0]
                     
                     for idx in anomaly_indices:
                         actual_idx = len(values) - 10 + idx
-                        anomalous_value = values[actual_idx][0]
+                        anomalous_value = float(values[actual_idx])
                         
                         await self._create_anomaly_alert(
                             metric_name, 
                             anomalous_value, 
-                            timestamps[actual_idx]
+                            float(timestamps[actual_idx])
                         )
             
             # Update performance baseline
             await self._update_performance_baseline(metric_name, values)
             
         except Exception as e:
-            self.logger.error(f"Error analyzing metric anomalies for {metric_name}: {e}")
+            self.logger.error("Error analyzing metric anomalies for %s: %s", metric_name, e)
+
+    def _fit_anomaly_model(self, values: np.ndarray) -> Tuple[Any, StandardScaler, Optional[float]]:
+        """Fit a scaler and a fresh copy of the detector on a metric's history"""
+        scaler = StandardScaler()
+        scaled = scaler.fit_transform(values)
+        detector = clone(self.anomaly_detector)
+        
+        if not ISOTREE_AVAILABLE:
+            return detector.fit(scaled), scaler, None
+        
+        # isotree predicts outlier scores, so derive the label cut-off from the training scores
+        detector.set_params(sample_size=min(256, len(scaled)))
+        detector.fit(scaled)
+        threshold = float(np.quantile(detector.predict(scaled), 1 - self.anomaly_contamination))
+        return detector, scaler, threshold
+
+    def _predict_anomalies(self, model: Tuple[Any, StandardScaler, Optional[float]],
+                           values: np.ndarray) -> np.ndarray:
+        """Label values as anomalous (-1) or normal (1) with a fitted model"""
+        detector, scaler, threshold = model
+        predictions = detector.predict(scaler.transform(values))
+        if threshold is None:
+            return predictions
+        return np.where(predictions > threshold, -1, 1)
 
     async def _update_performance_baseline(self, metric_name: str, values: np.ndarray):
         """Update performance baseline for a metric"""
@@ -573,16 +911,12 @@ class AutonomousMonitoringEngine:
             
             # Calculate baseline statistics
             baseline_value = np.median(values)
-            std_dev = np.std(values)
-            acceptable_deviation = std_dev * 2  # 2 standard deviations
+            acceptable_deviation = values.std() * 2  # 2 standard deviations
             
-            # Determine trend
+            # Determine trend from the means of the last two 10-sample windows
             if len(values) >= 20:
-                recent_values = values[-10:]
-                older_values = values[-20:-10]
-                
-                recent_mean = np.mean(recent_values)
-                older_mean = np.mean(older_values)
+                recent_mean = values[-10:].mean()
+                older_mean = values[-20:-10].mean()
                 
                 if recent_mean > older_mean * 1.05:
                     trend = 'up'
@@ -605,7 +939,7 @@ class AutonomousMonitoringEngine:
             )
             
         except Exception as e:
-            self.logger.error(f"Error updating performance baseline for {metric_name}: {e}")
+            self.logger.error("Error updating performance baseline for %s: %s", metric_name, e)
 
     async def _alert_processing_loop(self):
         """Process and manage alerts"""
@@ -613,11 +947,13 @@ class AutonomousMonitoringEngine:
         
         while self.is_monitoring:
             try:
+                now = time.time()
+                
                 # Check for alert escalations
-                await self._check_alert_escalations()
+                await self._check_alert_escalations(now)
                 
                 # Auto-resolve stale alerts
-                await self._auto_resolve_stale_alerts()
+                await self._auto_resolve_stale_alerts(now)
                 
                 # Update alert statistics
                 await self._update_alert_statistics()
@@ -625,7 +961,7 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(60)  # Process every minute
                 
             except Exception as e:
-                self.logger.error(f"Error in alert processing loop: {e}")
+                self.logger.error("Error in alert processing loop: %s", e)
                 await asyncio.sleep(120)
 
     async def _self_healing_loop(self):
@@ -634,11 +970,10 @@ class AutonomousMonitoringEngine:
         
         while self.is_monitoring:
             try:
-                if self.auto_healing_enabled:
+                if self.auto_healing_enabled and self._critical_unresolved:
                     # Check for critical alerts that need immediate action
                     critical_alerts = [
-                        alert for alert in self.alerts.values()
-                        if alert.severity == AlertSeverity.CRITICAL and not alert.resolved
+                        self.alerts[alert_id] for alert_id in list(self._critical_unresolved)
                     ]
                     
                     for alert in critical_alerts:
@@ -647,7 +982,7 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(30)  # Check every 30 seconds
                 
             except Exception as e:
-                self.logger.error(f"Error in self-healing loop: {e}")
+                self.logger.error("Error in self-healing loop: %s", e)
                 await asyncio.sleep(60)
 
     async def _performance_optimization_loop(self):
@@ -668,7 +1003,7 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(600)  # Run every 10 minutes
                 
             except Exception as e:
-                self.logger.error(f"Error in performance optimization loop: {e}")
+                self.logger.error("Error in performance optimization loop: %s", e)
                 await asyncio.sleep(900)
 
     async def _learning_adaptation_loop(self):
@@ -690,7 +1025,7 @@ class AutonomousMonitoringEngine:
                 await asyncio.sleep(1800)  # Run every 30 minutes
                 
             except Exception as e:
-                self.logger.error(f"Error in learning adaptation loop: {e}")
+                self.logger.error("Error in learning adaptation loop: %s", e)
                 await asyncio.sleep(3600)
 
     # Health check implementations
@@ -698,16 +1033,13 @@ class AutonomousMonitoringEngine:
         """Check CPU usage health"""
         try:
             # Get recent CPU metrics
-            cpu_metrics = [
-                m for m in list(self.metrics_buffer)[-20:]
-                if m.name == 'cpu_usage_percent'
-            ]
+            cpu_window = self.rolling_windows['cpu_usage_percent']
             
-            if not cpu_metrics:
+            if not cpu_window.points:
                 return {'healthy': True, 'message': 'No CPU data available'}
             
-            current_cpu = cpu_metrics[-1].value
-            avg_cpu = statistics.mean([m.value for m in cpu_metrics])
+            current_cpu = cpu_window.points[-1].value
+            avg_cpu = cpu_window.mean()
             
             # Check thresholds
             if current_cpu > 90 or avg_cpu > 85:
@@ -731,16 +1063,13 @@ class AutonomousMonitoringEngine:
     async def _check_memory_usage(self) -> Dict[str, Any]:
         """Check memory usage health"""
         try:
-            memory_metrics = [
-                m for m in list(self.metrics_buffer)[-20:]
-                if m.name == 'memory_usage_percent'
-            ]
+            memory_window = self.rolling_windows['memory_usage_percent']
             
-            if not memory_metrics:
+            if not memory_window.points:
                 return {'healthy': True, 'message': 'No memory data available'}
             
-            current_memory = memory_metrics[-1].value
-            avg_memory = statistics.mean([m.value for m in memory_metrics])
+            current_memory = memory_window.points[-1].value
+            avg_memory = memory_window.mean()
             
             if current_memory > 95 or avg_memory > 90:
                 return {
@@ -763,16 +1092,11 @@ class AutonomousMonitoringEngine:
     async def _check_disk_usage(self) -> Dict[str, Any]:
         """Check disk usage health"""
         try:
-            disk_metrics = [
-                m for m in list(self.metrics_buffer)[-10:]
-                if m.name == 'disk_usage_percent'
-            ]
+            current_disk = self._latest_value('disk_usage_percent')
             
-            if not disk_metrics:
+            if current_disk is None:
                 return {'healthy': True, 'message': 'No disk data available'}
             
-            current_disk = disk_metrics[-1].value
-            
             if current_disk > 90:
                 return {
                     'healthy': False,
@@ -792,16 +1116,13 @@ class AutonomousMonitoringEngine:
     async def _check_mining_performance(self) -> Dict[str, Any]:
         """Check mining performance health"""
         try:
-            hashrate_metrics = [
-                m for m in list(self.metrics_buffer)[-10:]
-                if m.name == 'mining_hashrate'
-            ]
+            hashrate_window = self.rolling_windows['mining_hashrate']
             
-            if not hashrate_metrics:
+            if not hashrate_window.points:
                 return {'healthy': True, 'message': 'No mining data available'}
             
-            current_hashrate = hashrate_metrics[-1].value
-            avg_hashrate = statistics.mean([m.value for m in hashrate_metrics])
+            current_hashrate = hashrate_window.points[-1].value
+            avg_hashrate = hashrate_window.mean()
             
             # Check if hashrate is significantly below average
             if current_hashrate < avg_hashrate * 0.7:
@@ -825,22 +1146,13 @@ class AutonomousMonitoringEngine:
     async def _check_treasury_health(self) -> Dict[str, Any]:
         """Check treasury health"""
         try:
-            value_metrics = [
-                m for m in list(self.metrics_buffer)[-5:]
-                if m.name == 'treasury_total_value_usd'
-            ]
+            current_value = self._latest_value('treasury_total_value_usd')
             
-            diversity_metrics = [
-                m for m in list(self.metrics_buffer)[-5:]
-                if m.name == 'treasury_diversity_score'
-            ]
+            current_diversity = self._latest_value('treasury_diversity_score')
             
-            if not value_metrics or not diversity_metrics:
+            if current_value is None or current_diversity is None:
                 return {'healthy': True, 'message': 'No treasury data available'}
             
-            current_value = value_metrics[-1].value
-            current_diversity = diversity_metrics[-1].value
-            
             # Check minimum thresholds
             if current_value < 100000:  # Below $100k
                 return {
@@ -869,16 +1181,11 @@ class AutonomousMonitoringEngine:
     async def _check_governance_participation(self) -> Dict[str, Any]:
         """Check governance participation health"""
         try:
-            participation_metrics = [
-                m for m in list(self.metrics_buffer)[-5:]
-                if m.name == 'governance_participation_rate'
-            ]
+            current_participation = self._latest_value('governance_participation_rate')
             
-            if not participation_metrics:
+            if current_participation is None:
                 return {'healthy': True, 'message': 'No governance data available'}
             
-            current_participation = participation_metrics[-1].value
-            
             if current_participation < 0.6:  # Below 60%
                 return {
                     'healthy': False,
@@ -900,7 +1207,7 @@ class AutonomousMonitoringEngine:
         try:
             # Simulate connectivity check
             # In production, this would test actual external connections
-            connectivity_score = np.random.uniform(0.8, 1.0)
+            connectivity_score = self._sim_rng.uniform(0.8, 1.0)
             
             if connectivity_score < 0.7:
                 return {
@@ -919,10 +1226,12 @@ class AutonomousMonitoringEngine:
             return {'healthy': False, 'message': f'Error checking connectivity: {e}'}
 
     # Alert management
-    async def _create_health_alert(self, health_check: HealthCheck, result: Dict[str, Any]):
+    async def _create_health_alert(self, health_check: HealthCheck, result: Dict[str, Any],
+                                   now: Optional[float] = None):
         """Create an alert for a failed health check"""
         try:
-            alert_id = f"health_{health_check.name}_{int(time.time())}"
+            now = time.time() if now is None else now
+            alert_id = ('health', health_check.name, int(now))
             
             # Determine severity based on consecutive failures
             if health_check.consecutive_failures >= health_check.failure_threshold * 2:
@@ -940,15 +1249,19 @@ class AutonomousMonitoringEngine:
                 metric_name=health_check.name,
                 current_value=result.get('current_value', 0),
                 threshold_value=result.get('threshold_value', 0),
-                timestamp=time.time()
+                timestamp=now
             )
             
             self.alerts[alert_id] = alert
+            self._unresolved_alerts[alert_id] = alert
+            self._unresolved_alerts_by_metric[alert.metric_name].add(alert_id)
             self.alert_history.append(alert)
             self.performance_metrics['total_alerts_generated'] += 1
+            if severity == AlertSeverity.CRITICAL:
+                self._critical_unresolved.add(alert_id)
             
             self.logger.warning(
-                f"🚨 ALERT [{severity.value.upper()}]: {alert.title} - {alert.description}"
+                "🚨 ALERT [%s]: %s - %s", severity.value.upper(), alert.title, alert.description
             )
             
             # Trigger recovery actions for critical alerts
@@ -956,12 +1269,12 @@ class AutonomousMonitoringEngine:
                 await self._execute_recovery_actions(alert)
             
         except Exception as e:
-            self.logger.error(f"Error creating health alert: {e}")
+            self.logger.error("Error creating health alert: %s", e)
 
     async def _create_anomaly_alert(self, metric_name: str, anomalous_value: float, timestamp: float):
         """Create an alert for detected anomaly"""
         try:
-            alert_id = f"anomaly_{metric_name}_{int(timestamp)}"
+            alert_id = ('anomaly', metric_name, int(timestamp))
             
             # Get baseline for comparison
             baseline = self.performance_baselines.get(metric_name)
@@ -979,18 +1292,21 @@ class AutonomousMonitoringEngine:
             )
             
             self.alerts[alert_id] = alert
+            self._unresolved_alerts[alert_id] = alert
+            self._unresolved_alerts_by_metric[alert.metric_name].add(alert_id)
             self.alert_history.append(alert)
             self.performance_metrics['total_alerts_generated'] += 1
             
-            self.logger.warning(f"🔍 ANOMALY DETECTED: {alert.description}")
+            self.logger.warning("🔍 ANOMALY DETECTED: %s", alert.description)
             
         except Exception as e:
-            self.logger.error(f"Error creating anomaly alert: {e}")
+            self.logger.error("Error creating anomaly alert: %s", e)
 
-    async def _create_timeout_alert(self, health_check: HealthCheck):
+    async def _create_timeout_alert(self, health_check: HealthCheck, now: Optional[float] = None):
         """Create an alert for health check timeout"""
         try:
-            alert_id = f"timeout_{health_check.name}_{int(time.time())}"
+            now = time.time() if now is None else now
+            alert_id = ('timeout', health_check.name, int(now))
             
             alert = Alert(
                 alert_id=alert_id,
@@ -1000,105 +1316,116 @@ class AutonomousMonitoringEngine:
                 metric_name=health_check.name,
                 current_value=health_check.timeout_seconds,
                 threshold_value=health_check.timeout_seconds,
-                timestamp=time.time()
+                timestamp=now
             )
             
             self.alerts[alert_id] = alert
+            self._unresolved_alerts[alert_id] = alert
+            self._unresolved_alerts_by_metric[alert.metric_name].add(alert_id)
             self.alert_history.append(alert)
             self.performance_metrics['total_alerts_generated'] += 1
             
-            self.logger.error(f"⏰ TIMEOUT ALERT: {alert.description}")
+            self.logger.error("⏰ TIMEOUT ALERT: %s", alert.description)
             
         except Exception as e:
-            self.logger.error(f"Error creating timeout alert: {e}")
+            self.logger.error("Error creating timeout alert: %s", e)
 
-    async def _resolve_alerts_for_check(self, check_name: str):
+    async def _resolve_alerts_for_check(self, check_name: str, now: Optional[float] = None):
         """Resolve all active alerts for a specific health check"""
         try:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             resolved_count = 0
             
-            for alert_id, alert in list(self.alerts.items()):
-                if alert.metric_name == check_name and not alert.resolved:
+            for alert_id in self._unresolved_alerts_by_metric.pop(check_name, ()):
+                alert = self._unresolved_alerts.pop(alert_id, None)
+                if alert is not None:
                     alert.resolved = True
                     alert.resolution_time = current_time
+                    self._record_recovery_time(alert)
+                    self._critical_unresolved.discard(alert_id)
                     resolved_count += 1
                     
                     self.performance_metrics['alerts_resolved_automatically'] += 1
                     
-                    self.logger.info(f"✅ Alert resolved: {alert.title}")
+                    self.logger.info("✅ Alert resolved: %s", alert.title)
             
             if resolved_count > 0:
-                self.logger.info(f"Resolved {resolved_count} alerts for {check_name}")
+                self.logger.info("Resolved %s alerts for %s", resolved_count, check_name)
                 
         except Exception as e:
-            self.logger.error(f"Error resolving alerts for {check_name}: {e}")
+            self.logger.error("Error resolving alerts for %s: %s", check_name, e)
+
+    def _record_recovery_time(self, alert: Alert):
+        """Add a resolved alert's time to recovery to the running window, if recovery ran"""
+        if alert.recovery_actions:
+            self._recovery_times.add(MetricData(
+                'time_to_recovery', alert.resolution_time - alert.timestamp, alert.resolution_time
+            ))
 
     # Recovery action implementations
     async def _execute_recovery_actions(self, alert: Alert):
         """Execute recovery actions for an alert"""
         try:
-            # Find the health check associated with this alert
-            health_check = None
-            for check in self.health_checks.values():
-                if check.name == alert.metric_name:
-                    health_check = check
-                    break
+            # Health checks are keyed by name, which health alerts carry as their metric name
+            health_check = self.health_checks.get(alert.metric_name)
             
             if not health_check:
-                self.logger.warning(f"No health check found for alert {alert.alert_id}")
+                self.logger.warning("No health check found for alert %s", format_alert_id(alert.alert_id))
                 return
             
-            self.logger.info(f"🔧 Executing recovery actions for alert: {alert.title}")
+            self.logger.info("🔧 Executing recovery actions for alert: %s", alert.title)
             
             recovery_success = False
             
-            for action in health_check.recovery_actions:
+            for action_name, action_func in self._recovery_plans.get(health_check.name, ()):
                 try:
-                    self.logger.info(f"Executing recovery action: {action.value}")
+                    self.logger.info("Executing recovery action: %s", action_name)
+                    
+                    result = await action_func(alert, health_check)
                     
-                    action_func = self.recovery_actions.get(action)
-                    if action_func:
-                        result = await action_func(alert, health_check)
+                    if result.get('success', False):
+                        recovery_success = True
+                        alert.recovery_actions.append(action_name)
                         
-                        if result.get('success', False):
-                            recovery_success = True
-                            alert.recovery_actions.append(action.value)
-                            
-                            self.performance_metrics['recovery_actions_executed'] += 1
-                            
-                            self.logger.info(f"✅ Recovery action {action.value} succeeded")
-                            break
-                        else:
-                            self.logger.warning(f"❌ Recovery action {action.value} failed: {result.get('error')}")
+                        self.performance_metrics['recovery_actions_executed'] += 1
+                        
+                        self.logger.info("✅ Recovery action %s succeeded", action_name)
+                        break
+                    else:
+                        self.logger.warning("❌ Recovery action %s failed: %s", action_name, result.get('error'))
                     
                 except Exception as e:
-                    self.logger.error(f"Error executing recovery action {action.value}: {e}")
+                    self.logger.error("Error executing recovery action %s: %s", action_name, e)
             
             if recovery_success:
                 self.performance_metrics['successful_recoveries'] += 1
                 
                 # Record recovery in history
                 self.recovery_history.append({
-                    'alert_id': alert.alert_id,
+                    'alert_id': format_alert_id(alert.alert_id),
                     'actions_executed': alert.recovery_actions,
                     'success': True,
                     'timestamp': time.time()
                 })
             
         except Exception as e:
-            self.logger.error(f"Error executing recovery actions: {e}")
+            self.logger.error("Error executing recovery actions: %s", e)
+
+    async def _simulate_action_delay(self, action: RecoveryAction):
+        """Wait out a recovery action's simulated duration when I/O simulation is on"""
+        if self.simulate_io:
+            await asyncio.sleep(self.simulation_delays.get(action, 0))
 
     async def _restart_service(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Restart a service as recovery action"""
         try:
-            self.logger.info(f"Restarting service for {health_check.name}")
+            self.logger.info("Restarting service for %s", health_check.name)
             
             # Simulate service restart
-            await asyncio.sleep(2)
+            await self._simulate_action_delay(RecoveryAction.RESTART_SERVICE)
             
             # In production, this would actually restart the relevant service
-            success = np.random.random() > 0.2  # 80% success rate
+            success = self._sim_rng.random() > 0.2  # 80% success rate
             
             if success:
                 return {'success': True, 'message': f'Service restarted for {health_check.name}'}
@@ -1111,12 +1438,12 @@ class AutonomousMonitoringEngine:
     async def _scale_resources(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Scale resources as recovery action"""
         try:
-            self.logger.info(f"Scaling resources for {health_check.name}")
+            self.logger.info("Scaling resources for %s", health_check.name)
             
             # Simulate resource scaling
-            await asyncio.sleep(3)
+            await self._simulate_action_delay(RecoveryAction.SCALE_RESOURCES)
             
-            success = np.random.random() > 0.3  # 70% success rate
+            success = self._sim_rng.random() > 0.3  # 70% success rate
             
             if success:
                 return {'success': True, 'message': f'Resources scaled for {health_check.name}'}
@@ -1129,12 +1456,12 @@ class AutonomousMonitoringEngine:
     async def _rollback_changes(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Rollback recent changes as recovery action"""
         try:
-            self.logger.info(f"Rolling back changes for {health_check.name}")
+            self.logger.info("Rolling back changes for %s", health_check.name)
             
             # Simulate rollback
-            await asyncio.sleep(5)
+            await self._simulate_action_delay(RecoveryAction.ROLLBACK_CHANGES)
             
-            success = np.random.random() > 0.1  # 90% success rate
+            success = self._sim_rng.random() > 0.1  # 90% success rate
             
             if success:
                 return {'success': True, 'message': f'Changes rolled back for {health_check.name}'}
@@ -1147,12 +1474,12 @@ class AutonomousMonitoringEngine:
     async def _failover(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Execute failover as recovery action"""
         try:
-            self.logger.info(f"Executing failover for {health_check.name}")
+            self.logger.info("Executing failover for %s", health_check.name)
             
             # Simulate failover
-            await asyncio.sleep(10)
+            await self._simulate_action_delay(RecoveryAction.FAILOVER)
             
-            success = np.random.random() > 0.15  # 85% success rate
+            success = self._sim_rng.random() > 0.15  # 85% success rate
             
             if success:
                 return {'success': True, 'message': f'Failover completed for {health_check.name}'}
@@ -1165,12 +1492,12 @@ class AutonomousMonitoringEngine:
     async def _optimize_configuration(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Optimize configuration as recovery action"""
         try:
-            self.logger.info(f"Optimizing configuration for {health_check.name}")
+            self.logger.info("Optimizing configuration for %s", health_check.name)
             
             # Simulate configuration optimization
-            await asyncio.sleep(3)
+            await self._simulate_action_delay(RecoveryAction.OPTIMIZE_CONFIGURATION)
             
-            success = np.random.random() > 0.25  # 75% success rate
+            success = self._sim_rng.random() > 0.25  # 75% success rate
             
             if success:
                 return {'success': True, 'message': f'Configuration optimized for {health_check.name}'}
@@ -1183,12 +1510,12 @@ class AutonomousMonitoringEngine:
     async def _clear_cache(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Clear cache as recovery action"""
         try:
-            self.logger.info(f"Clearing cache for {health_check.name}")
+            self.logger.info("Clearing cache for %s", health_check.name)
             
             # Simulate cache clearing
-            await asyncio.sleep(1)
+            await self._simulate_action_delay(RecoveryAction.CLEAR_CACHE)
             
-            success = np.random.random() > 0.05  # 95% success rate
+            success = self._sim_rng.random() > 0.05  # 95% success rate
             
             if success:
                 return {'success': True, 'message': f'Cache cleared for {health_check.name}'}
@@ -1201,12 +1528,12 @@ class AutonomousMonitoringEngine:
     async def _repair_data(self, alert: Alert, health_check: HealthCheck) -> Dict[str, Any]:
         """Repair data as recovery action"""
         try:
-            self.logger.info(f"Repairing data for {health_check.name}")
+            self.logger.info("Repairing data for %s", health_check.name)
             
             # Simulate data repair
-            await asyncio.sleep(15)
+            await self._simulate_action_delay(RecoveryAction.REPAIR_DATA)
             
-            success = np.random.random() > 0.4  # 60% success rate
+            success = self._sim_rng.random() > 0.4  # 60% success rate
             
             if success:
                 return {'success': True, 'message': f'Data repaired for {health_check.name}'}
@@ -1220,26 +1547,14 @@ class AutonomousMonitoringEngine:
     async def _update_overall_health(self):
         """Update overall system health status"""
         try:
-            # Count health check statuses
-            total_checks = len([hc for hc in self.health_checks.values() if hc.enabled])
+            # Health check statuses are counted as checks change bucket
+            healthy_checks = self._health_status_counts['healthy']
+            warning_checks = self._health_status_counts['warning']
+            critical_checks = self._health_status_counts['critical']
+            total_checks = healthy_checks + warning_checks + critical_checks
             if total_checks == 0:
                 return
             
-            healthy_checks = 0
-            warning_checks = 0
-            critical_checks = 0
-            
-            for health_check in self.health_checks.values():
-                if not health_check.enabled:
-                    continue
-                
-                if health_check.consecutive_failures == 0:
-                    healthy_checks += 1
-                elif health_check.consecutive_failures < health_check.failure_threshold:
-                    warning_checks += 1
-                else:
-                    critical_checks += 1
-            
             # Calculate health score
             health_score = (
                 (healthy_checks * 1.0 + warning_checks * 0.5 + critical_checks * 0.0) / 
@@ -1265,73 +1580,100 @@ class AutonomousMonitoringEngine:
                 self.overall_health_score = health_score
                 
                 self.logger.info(
-                    f"🏥 Health status updated: {previous_status.value} → {health_status.value} "
-                    f"(score: {health_score:.2f})"
+                    "🏥 Health status updated: %s → %s (score: %.2f)",
+                    previous_status.value, health_status.value, health_score
                 )
                 
                 # Record health score metric
                 await self._record_metric('overall_health_score', health_score)
             
         except Exception as e:
-            self.logger.error(f"Error updating overall health: {e}")
+            self.logger.error("Error updating overall health: %s", e)
 
     async def _cleanup_old_metrics(self):
         """Clean up old metric data"""
         try:
-            if not self.metrics_buffer:
-                return
-            
             cutoff_time = time.time() - (self.metric_retention_hours * 3600)
             
-            # Remove old metrics
+            # Remove old metrics; they are stamped on insertion, so the oldest are at the front
             while self.metrics_buffer and self.metrics_buffer[0].timestamp < cutoff_time:
                 self.metrics_buffer.popleft()
             
+            for metric_name, series in list(self.metrics_by_name.items()):
+                series.expire(cutoff_time)
+                if not series:
+                    del self.metrics_by_name[metric_name]
+                    self._anomaly_models.pop(metric_name, None)
+                    self._anomaly_checked_counts.pop(metric_name, None)
+            
+            for window in self.rolling_windows.values():
+                window.expire(cutoff_time)
+            
+            # Alert timestamps are not in insertion order (anomaly alerts carry the
+            # sample's time), so alerts are expired by timestamp rather than from the front
+            retained_history = [alert for alert in self.alert_history if alert.timestamp >= cutoff_time]
+            if len(retained_history) < len(self.alert_history):
+                self.alert_history.clear()
+                self.alert_history.extend(retained_history)
+            
+            # Drop expired resolved alerts; unresolved ones stay until they are resolved
+            expired_alert_ids = [
+                alert_id for alert_id, alert in self.alerts.items()
+                if alert.resolved and alert.timestamp < cutoff_time
+            ]
+            for alert_id in expired_alert_ids:
+                del self.alerts[alert_id]
+            
         except Exception as e:
-            self.logger.error(f"Error cleaning up old metrics: {e}")
+            self.logger.error("Error cleaning up old metrics: %s", e)
 
-    async def _check_alert_escalations(self):
+    async def _check_alert_escalations(self, now: Optional[float] = None):
         """Check if alerts need escalation"""
         try:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             
-            for alert in self.alerts.values():
-                if alert.resolved:
-                    continue
-                
+            for alert in self._unresolved_alerts.values():
                 # Escalate alerts that have been active for too long
                 alert_age = current_time - alert.timestamp
+                if alert_age <= 3600:  # 1 hour
+                    continue
                 
-                if alert_age > 3600 and alert.severity != AlertSeverity.CRITICAL:  # 1 hour
+                if alert.severity != AlertSeverity.CRITICAL:
                     alert.severity = AlertSeverity.CRITICAL
-                    self.logger.warning(f"🔺 Alert escalated to CRITICAL: {alert.title}")
+                    self._critical_unresolved.add(alert.alert_id)
+                    self.logger.warning("🔺 Alert escalated to CRITICAL: %s", alert.title)
                 
         except Exception as e:
-            self.logger.error(f"Error checking alert escalations: {e}")
+            self.logger.error("Error checking alert escalations: %s", e)
 
-    async def _auto_resolve_stale_alerts(self):
+    async def _auto_resolve_stale_alerts(self, now: Optional[float] = None):
         """Auto-resolve stale alerts"""
         try:
-            current_time = time.time()
+            current_time = time.time() if now is None else now
             resolved_count = 0
             
-            for alert_id, alert in list(self.alerts.items()):
-                if alert.resolved:
+            # Alert timestamps are not in creation order (anomaly alerts carry the
+            # sample's time), so every unresolved alert is checked
+            for alert_id, alert in list(self._unresolved_alerts.items()):
+                # Auto-resolve alerts older than 24 hours
+                if (current_time - alert.timestamp) <= 86400:
                     continue
                 
-                # Auto-resolve alerts older than 24 hours
-                if (current_time - alert.timestamp) > 86400:
-                    alert.resolved = True
-                    alert.resolution_time = current_time
-                    resolved_count += 1
-                    
-                    self.logger.info(f"🕐 Auto-resolved stale alert: {alert.title}")
+                alert.resolved = True
+                alert.resolution_time = current_time
+                self._record_recovery_time(alert)
+                del self._unresolved_alerts[alert_id]
+                self._critical_unresolved.discard(alert_id)
+                self._unresolved_alerts_by_metric[alert.metric_name].discard(alert_id)
+                resolved_count += 1
+                
+                self.logger.info("🕐 Auto-resolved stale alert: %s", alert.title)
             
             if resolved_count > 0:
-                self.logger.info(f"Auto-resolved {resolved_count} stale alerts")
+                self.logger.info("Auto-resolved %s stale alerts", resolved_count)
                 
         except Exception as e:
-            self.logger.error(f"Error auto-resolving stale alerts: {e}")
+            self.logger.error("Error auto-resolving stale alerts: %s", e)
 
     async def _update_alert_statistics(self):
         """Update alert-related statistics"""
@@ -1343,30 +1685,47 @@ class AutonomousMonitoringEngine:
                 self.performance_metrics['false_positive_rate'] = auto_resolved / len(resolved_alerts)
             
             # Calculate mean time to detection (simulated)
-            self.performance_metrics['mean_time_to_detection'] = np.random.uniform(30, 120)  # seconds
-            
-            # Calculate mean time to recovery
-            recovery_times = []
-            for alert in resolved_alerts[-50:]:  # Last 50 resolved alerts
-                if alert.resolution_time and alert.recovery_actions:
-                    recovery_time = alert.resolution_time - alert.timestamp
-                    recovery_times.append(recovery_time)
+            self.performance_metrics['mean_time_to_detection'] = self._sim_rng.uniform(30, 120)  # seconds
             
-            if recovery_times:
-                self.performance_metrics['mean_time_to_recovery'] = statistics.mean(recovery_times)
+            # Mean time to recovery over the last 50 recovered alerts, kept as they resolve
+            if self._recovery_times.points:
+                self.performance_metrics['mean_time_to_recovery'] = self._recovery_times.mean()
             
         except Exception as e:
-            self.logger.error(f"Error updating alert statistics: {e}")
+            self.logger.error("Error updating alert statistics: %s", e)
 
     async def _analyze_performance_trends(self):
         """Analyze performance trends across metrics"""
         try:
-            # This would implement sophisticated trend analysis
-            # For now, just log that trend analysis is running
             self.logger.info("📈 Analyzing performance trends...")
             
+            # Compare the last hour (1-minute buckets) with the last day (5-minute buckets)
+            for metric_name, history in self.metric_history.items():
+                hourly = history.buckets(0)
+                daily = history.buckets(1)
+                if not hourly or not daily:
+                    continue
+                
+                hour_mean = sum(b.total for b in hourly) / sum(b.count for b in hourly)
+                day_mean = sum(b.total for b in daily) / sum(b.count for b in daily)
+                change = (hour_mean - day_mean) / abs(day_mean) if day_mean else 0.0
+                
+                if change > 0.05:
+                    direction = 'up'
+                elif change < -0.05:
+                    direction = 'down'
+                else:
+                    direction = 'stable'
+                
+                self.performance_trends[metric_name] = {
+                    'hour_mean': hour_mean,
+                    'day_mean': day_mean,
+                    'change': change,
+                    'direction': direction
+                }
+            
         except Exception as e:
-            self.logger.error(f"Error analyzing performance trends: {e}")
+            self.logger.error("Error analyzing performance trends: %s", e)
 
     async def _generate_optimization_recommendations(self):
         """Generate performance optimization recommendations"""
@@ -1376,7 +1735,7 @@ class AutonomousMonitoringEngine:
             self.logger.info("💡 Generating optimization recommendations...")
             
         except Exception as e:
-            self.logger.error(f"Error generating optimization recommendations: {e}")
+            self.logger.error("Error generating optimization recommendations: %s", e)
 
     async def _execute_performance_optimizations(self):
         """Execute approved performance optimizations"""
@@ -1386,7 +1745,7 @@ class AutonomousMonitoringEngine:
             self.logger.info("⚡ Executing performance optimizations...")
             
         except Exception as e:
-            self.logger.error(f"Error executing performance optimizations: {e}")
+            self.logger.error("Error executing performance optimizations: %s", e)
 
     async def _adapt_alert_thresholds(self):
         """Adapt alert thresholds based on historical data"""
@@ -1396,7 +1755,7 @@ class AutonomousMonitoringEngine:
             self.logger.info("🎯 Adapting alert thresholds...")
             
         except Exception as e:
-            self.logger.error(f"Error adapting alert thresholds: {e}")
+            self.logger.error("Error adapting alert thresholds: %s", e)
 
     async def _learn_from_recovery_actions(self):
         """Learn from the effectiveness of recovery actions"""
@@ -1406,47 +1765,55 @@ class AutonomousMonitoringEngine:
             self.logger.info("🧠 Learning from recovery actions...")
             
         except Exception as e:
-            self.logger.error(f"Error learning from recovery actions: {e}")
+            self.logger.error("Error learning from recovery actions: %s", e)
 
     async def _update_anomaly_models(self):
         """Update anomaly detection models with new data"""
         try:
-            # This would retrain anomaly detection models with recent data
-            # For now, just log that models are being updated
             self.logger.info("🔄 Updating anomaly detection models...")
             
+            # Refit one model per metric on its full retained history
+            loop = asyncio.get_running_loop()
+            for metric_name in list(self.metrics_by_name):
+                series = self.metrics_by_name[metric_name]
+                if len(series) < 50:
+                    continue
+                
+                _, values = series.tail(len(series))
+                self._anomaly_models[metric_name] = await loop.run_in_executor(
+                    self._executor, self._fit_anomaly_model, values.reshape(-1, 1)
+                )
+            
         except Exception as e:
-            self.logger.error(f"Error updating anomaly models: {e}")
+            self.logger.error("Error updating anomaly models: %s", e)
 
     async def get_monitoring_status(self) -> Dict[str, Any]:
         """Get current monitoring system status"""
         try:
-            active_alerts = [a for a in self.alerts.values() if not a.resolved]
-            
             return {
                 'is_monitoring': self.is_monitoring,
                 'health_status': self.health_status.value,
                 'overall_health_score': self.overall_health_score,
-                'active_alerts': len(active_alerts),
+                'active_alerts': len(self._unresolved_alerts),
                 'total_metrics_collected': len(self.metrics_buffer),
-                'health_checks_enabled': len([hc for hc in self.health_checks.values() if hc.enabled]),
+                'health_checks_enabled': len(self._enabled_checks),
                 'auto_healing_enabled': self.auto_healing_enabled,
                 'learning_enabled': self.learning_enabled,
-                'performance_metrics': self.performance_metrics.copy(),
+                'performance_metrics': dict(self._performance_metrics_view),  # JSON-serializable snapshot
                 'recent_alerts': [
                     {
-                        'alert_id': a.alert_id,
+                        'alert_id': format_alert_id(a.alert_id),
                         'severity': a.severity.value,
                         'title': a.title,
                         'timestamp': a.timestamp,
                         'resolved': a.resolved
                     }
-                    for a in list(self.alert_history)[-10:]
+                    for a in list(islice(reversed(self.alert_history), 10))[::-1]
                 ]
             }
             
         except Exception as e:
-            self.logger.error(f"Error getting monitoring status: {e}")
+            self.logger.error("Error getting monitoring status: %s", e)
             return {'error': str(e)}
 
     async def enable_auto_healing(self):
@@ -1459,6 +1826,42 @@ class AutonomousMonitoringEngine:
         self.auto_healing_enabled = False
         self.logger.info("🔧 Auto-healing disabled")
 
+    async def enable_health_check(self, name: str) -> bool:
+        """Enable a health check by name"""
+        health_check = self.health_checks.get(name)
+        if health_check is None:
+            return False
+        
+        if not health_check.enabled:
+            health_check.enabled = True
+            self._enabled_checks[name] = health_check
+            self._health_status_counts[self._health_bucket(health_check)] += 1
+            self.logger.info("🩺 Health check enabled: %s", name)
+        return True
+
+    async def disable_health_check(self, name: str) -> bool:
+        """Disable a health check by name"""
+        health_check = self.health_checks.get(name)
+        if health_check is None:
+            return False
+        
+        if health_check.enabled:
+            health_check.enabled = False
+            del self._enabled_checks[name]
+            self._health_status_counts[self._health_bucket(health_check)] -= 1
+            self.logger.info("🩺 Health check disabled: %s", name)
+        return True
+
+    async def enable_simulation(self):
+        """Enable simulated recovery action delays"""
+        self.simulate_io = True
+        self.logger.info("⏳ Recovery simulation delays enabled")
+
+    async def disable_simulation(self):
+        """Disable simulated recovery action delays"""
+        self.simulate_io = False
+        self.logger.info("⏳ Recovery simulation delays disabled")
+
     async def enable_learning(self):
         """Enable learning and adaptation"""
         self.learning_enabled = True
@@ -20,11 +20,15 @@ import asyncio
 import json
 import time
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
 from decimal import Decimal
 import os
 import sys
 import hashlib
+import heapq
+import math
+import random
+from collections import Counter, deque
+from itertools import compress, islice
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -36,6 +40,23 @@ from services.treasury_service import TreasuryService
 from services.ip_nft_service import IPNFTService
 from services.governance_service import GovernanceService
 
+# Decision priorities in execution order
+_PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+
+def _decayed_success_rate(succeeded, timestamps, now, half_life):
+    """Success rate with each outcome weighted by exponential decay on its age"""
+    decay = math.log(2) / half_life
+    weighted_successes = 0.0
+    total_weight = 0.0
+    for success, timestamp in zip(succeeded, timestamps):
+        weight = math.exp(-decay * (now - timestamp))
+        total_weight += weight
+        if success:
+            weighted_successes += weight
+    return weighted_successes / total_weight if total_weight > 0 else 0.0
+
+
 class EnhancedElizaAgent:
     """
     Enhanced Autonomous Eliza AI Agent for XMRT DAO Ecosystem
@@ -51,6 +72,14 @@ class EnhancedElizaAgent:
     - MESHNET preparation for decentralized communication
     """
 
+    # Decision type -> executor method
+    _DECISION_HANDLERS = {
+        'mining_optimization': 'execute_mining_optimization',
+        'treasury_rebalancing': 'execute_treasury_rebalancing',
+        'governance_enhancement': 'execute_governance_enhancement',
+        'ecosystem_improvement': 'execute_ecosystem_improvement'
+    }
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = self._setup_logging()
@@ -69,20 +98,31 @@ class EnhancedElizaAgent:
         self.learning_rate = 0.01
         self.governance_efficiency_target = 0.95  # 95% efficiency target
 
-        # Enhanced Memory and State Management
+        # Enhanced Memory and State Management (bounded; oldest entries are evicted)
+        memory_cap = config.get('memory_cap', 10000)
         self.memory = {
-            'mining_performance': [],
-            'treasury_decisions': [],
-            'governance_participation': [],
-            'ip_ownership_validations': [],
-            'cross_chain_operations': [],
-            'learning_outcomes': []
+            'mining_performance': deque(maxlen=100),  # Keep only recent performance data
+            'treasury_decisions': deque(maxlen=memory_cap),
+            'governance_participation': deque(maxlen=memory_cap),
+            'ip_ownership_validations': deque(maxlen=memory_cap),
+            'cross_chain_operations': deque(maxlen=memory_cap),
+            'learning_outcomes': deque(maxlen=memory_cap)
         }
 
         self.current_tasks = []
         self.completed_tasks = []
         self.created_applications = []
 
+        # Decision outcome log as parallel columns for learning analytics
+        self._outcome_types = deque(maxlen=memory_cap)
+        self._outcome_succeeded = deque(maxlen=memory_cap)
+        self._outcome_timestamps = deque(maxlen=memory_cap)
+
+        # Cycle triggers (scheduled ticks and ecosystem events); created on activation
+        self._cycle_triggers: Optional[asyncio.Queue] = None
+        self._low_hashrate_alert = False
+        self._consecutive_cycle_errors = 0
+
         # Decision-making framework
         self.decision_criteria = {
             'treasury_health': 0.25,
@@ -149,7 +189,7 @@ class EnhancedElizaAgent:
             self.logger.info("All ecosystem services initialized successfully")
 
         except Exception as e:
-            self.logger.error(f"Error initializing services: {e}")
+            self.logger.error("Error initializing services: %s", e)
             raise
 
     async def activate(self) -> Dict[str, Any]:
@@ -166,8 +206,10 @@ class EnhancedElizaAgent:
             # Initialize mining monitoring
             await self.initialize_mining_monitoring()
 
-            # Start autonomous operation cycles
+            # Start autonomous operation cycles, woken by the scheduler or by events
+            self._cycle_triggers = asyncio.Queue()
             asyncio.create_task(self.autonomous_operation_cycle())
+            asyncio.create_task(self.cycle_scheduler())
 
             activation_result = {
                 'status': 'active',
@@ -181,7 +223,7 @@ class EnhancedElizaAgent:
             return activation_result
 
         except Exception as e:
-            self.logger.error(f"Error activating agent: {e}")
+            self.logger.error("Error activating agent: %s", e)
             self.is_active = False
             return {'status': 'error', 'error': str(e)}
 
@@ -196,9 +238,10 @@ class EnhancedElizaAgent:
 
             if ip_validation['is_owner']:
                 self.logger.info("✅ XMRT-IP NFT ownership validated - full privileges enabled")
+                validated_at = int(time.time())
                 self.memory['ip_ownership_validations'].append({
                     'validated': True,
-                    'timestamp': int(time.time()),
+                    'timestamp': validated_at,
                     'privileges': 'full'
                 })
 
@@ -206,7 +249,7 @@ class EnhancedElizaAgent:
                     'valid': True,
                     'owner': self.creator_wallet,
                     'privileges': 'full',
-                    'timestamp': int(time.time())
+                    'timestamp': validated_at
                 }
             else:
                 self.logger.warning("❌ XMRT-IP NFT ownership not confirmed")
@@ -217,7 +260,7 @@ class EnhancedElizaAgent:
                 }
 
         except Exception as e:
-            self.logger.error(f"Error validating IP ownership: {e}")
+            self.logger.error("Error validating IP ownership: %s", e)
             return {
                 'valid': False,
                 'error': str(e),
@@ -245,7 +288,19 @@ class EnhancedElizaAgent:
             self.logger.info("✅ Mining monitoring initialized successfully")
 
         except Exception as e:
-            self.logger.error(f"Error initializing mining monitoring: {e}")
+            self.logger.error("Error initializing mining monitoring: %s", e)
+
+    def request_cycle(self, reason: str):
+        """Wake the autonomous operation cycle for an ecosystem event"""
+        if self.is_active and self._cycle_triggers is not None:
+            self._cycle_triggers.put_nowait(reason)
+
+    async def cycle_scheduler(self):
+        """Periodic producer of autonomous cycle triggers"""
+        cycle_interval = self.config.get('agent_cycle_interval', 300)  # 5 minutes default
+        while self.is_active:
+            self.request_cycle('scheduled')
+            await asyncio.sleep(cycle_interval)
 
     async def autonomous_operation_cycle(self):
         """Main autonomous operation cycle"""
@@ -253,11 +308,21 @@ class EnhancedElizaAgent:
 
         cycle_count = 0
         while self.is_active:
+            # Sleep until there is work; None is the shutdown sentinel
+            reason = await self._cycle_triggers.get()
+            if reason is None:
+                break
+
+            # Triggers queued while the previous cycle ran are served by this one
+            while not self._cycle_triggers.empty():
+                if self._cycle_triggers.get_nowait() is None:
+                    return
+
             try:
                 cycle_count += 1
                 cycle_start = time.time()
 
-                self.logger.info(f"🔄 Autonomous cycle #{cycle_count} starting...")
+                self.logger.info("🔄 Autonomous cycle #%s starting (%s)...", cycle_count, reason)
 
                 # 1. Analyze current ecosystem state
                 ecosystem_analysis = await self.analyze_ecosystem_state()
@@ -274,52 +339,50 @@ class EnhancedElizaAgent:
                 # 5. Report cycle completion
                 cycle_duration = time.time() - cycle_start
                 await self.report_cycle_completion(cycle_count, cycle_duration, execution_results)
-
-                # Wait for next cycle (configurable interval)
-                cycle_interval = self.config.get('agent_cycle_interval', 300)  # 5 minutes default
-                await asyncio.sleep(cycle_interval)
+                self._consecutive_cycle_errors = 0
 
             except Exception as e:
-                self.logger.error(f"Error in autonomous cycle #{cycle_count}: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute on error
+                self.logger.error("Error in autonomous cycle #%s: %s", cycle_count, e)
+
+                # Exponential backoff from 1 minute with jitter to spread retries, capped at 10
+                delay = min(600, 60 * 2 ** min(self._consecutive_cycle_errors, 10) * (0.5 + random.random()))
+                self._consecutive_cycle_errors += 1
+                await asyncio.sleep(delay)
 
     async def analyze_ecosystem_state(self) -> Dict[str, Any]:
         """Comprehensive ecosystem state analysis"""
         try:
             analysis_start = time.time()
 
-            # Analyze mining performance
-            mining_analysis = await self.analyze_mining_performance()
-
-            # Analyze treasury health
-            treasury_analysis = await self.analyze_treasury_health()
-
-            # Analyze governance participation
-            governance_analysis = await self.analyze_governance_state()
-
-            # Analyze IP protection status
-            ip_analysis = await self.analyze_ip_protection()
+            # Analyze mining, treasury, governance and IP protection concurrently
+            mining_analysis, treasury_analysis, governance_analysis, ip_analysis = await asyncio.gather(
+                self.analyze_mining_performance(),
+                self.analyze_treasury_health(),
+                self.analyze_governance_state(),
+                self.analyze_ip_protection()
+            )
 
             # Calculate overall ecosystem health score
             health_score = self.calculate_ecosystem_health(
                 mining_analysis, treasury_analysis, governance_analysis, ip_analysis
             )
 
+            analysis_end = time.time()
             ecosystem_state = {
                 'mining': mining_analysis,
                 'treasury': treasury_analysis,
                 'governance': governance_analysis,
                 'ip_protection': ip_analysis,
                 'overall_health': health_score,
-                'analysis_duration': time.time() - analysis_start,
-                'timestamp': int(time.time())
+                'analysis_duration': analysis_end - analysis_start,
+                'timestamp': int(analysis_end)
             }
 
-            self.logger.info(f"📊 Ecosystem analysis complete - Health Score: {health_score:.2f}/10")
+            self.logger.info("📊 Ecosystem analysis complete - Health Score: %.2f/10", health_score)
             return ecosystem_state
 
         except Exception as e:
-            self.logger.error(f"Error analyzing ecosystem state: {e}")
+            self.logger.error("Error analyzing ecosystem state: %s", e)
             return {'error': str(e), 'overall_health': 0}
 
     async def analyze_mining_performance(self) -> Dict[str, Any]:
@@ -333,7 +396,8 @@ class EnhancedElizaAgent:
             worker_count = len(mining_stats.get('leaderboard', []))
 
             # Historical comparison
-            recent_performance = self.memory['mining_performance'][-10:] if self.memory['mining_performance'] else []
+            performance_history = self.memory['mining_performance']
+            recent_performance = list(islice(performance_history, max(len(performance_history) - 10, 0), None))
             avg_hashrate = sum(p['stats'].get('miner', {}).get('hashrate', 0) for p in recent_performance) / max(len(recent_performance), 1)
 
             performance_trend = 'improving' if current_hashrate > avg_hashrate else 'declining' if current_hashrate < avg_hashrate else 'stable'
@@ -351,7 +415,7 @@ class EnhancedElizaAgent:
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Error analyzing mining performance: {e}")
+            self.logger.error("Error analyzing mining performance: %s", e)
             return {'error': str(e), 'efficiency_score': 0}
 
     async def analyze_treasury_health(self) -> Dict[str, Any]:
@@ -378,7 +442,7 @@ class EnhancedElizaAgent:
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Error analyzing treasury health: {e}")
+            self.logger.error("Error analyzing treasury health: %s", e)
             return {'error': str(e), 'health_score': 0}
 
     async def analyze_governance_state(self) -> Dict[str, Any]:
@@ -404,7 +468,7 @@ class EnhancedElizaAgent:
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Error analyzing governance state: {e}")
+            self.logger.error("Error analyzing governance state: %s", e)
             return {'error': str(e), 'efficiency_score': 0}
 
     async def analyze_ip_protection(self) -> Dict[str, Any]:
@@ -423,7 +487,7 @@ class EnhancedElizaAgent:
             return analysis
 
         except Exception as e:
-            self.logger.error(f"Error analyzing IP protection: {e}")
+            self.logger.error("Error analyzing IP protection: %s", e)
             return {'error': str(e), 'protection_level': 'unknown'}
 
     def calculate_ecosystem_health(self, mining, treasury, governance, ip) -> float:
@@ -445,12 +509,12 @@ class EnhancedElizaAgent:
             return min(weighted_score, 10.0)
 
         except Exception as e:
-            self.logger.error(f"Error calculating ecosystem health: {e}")
+            self.logger.error("Error calculating ecosystem health: %s", e)
             return 0.0
 
     async def make_strategic_decisions(self, ecosystem_analysis: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Make strategic decisions based on ecosystem analysis"""
-        decisions = []
+        candidates = []
 
         try:
             health_score = ecosystem_analysis.get('overall_health', 0)
@@ -458,7 +522,7 @@ class EnhancedElizaAgent:
             # Mining optimization decisions
             mining_analysis = ecosystem_analysis.get('mining', {})
             if mining_analysis.get('alert_level') == 'high':
-                decisions.append({
+                candidates.append({
                     'type': 'mining_optimization',
                     'action': 'investigate_low_hashrate',
                     'priority': 'high',
@@ -468,7 +532,7 @@ class EnhancedElizaAgent:
             # Treasury rebalancing decisions
             treasury_analysis = ecosystem_analysis.get('treasury', {})
             if treasury_analysis.get('rebalancing_recommended'):
-                decisions.append({
+                candidates.append({
                     'type': 'treasury_rebalancing',
                     'action': 'diversify_assets',
                     'priority': 'medium',
@@ -478,7 +542,7 @@ class EnhancedElizaAgent:
             # Governance participation decisions
             governance_analysis = ecosystem_analysis.get('governance', {})
             if governance_analysis.get('performance_gap', 0) > 0.1:
-                decisions.append({
+                candidates.append({
                     'type': 'governance_enhancement',
                     'action': 'increase_participation',
                     'priority': 'medium',
@@ -487,36 +551,50 @@ class EnhancedElizaAgent:
 
             # Overall health improvement
             if health_score < 7:
-                decisions.append({
+                candidates.append({
                     'type': 'ecosystem_improvement',
                     'action': 'comprehensive_optimization',
                     'priority': 'high',
                     'rationale': f'Overall ecosystem health at {health_score:.1f}/10'
                 })
 
-            self.logger.info(f"📋 Generated {len(decisions)} strategic decisions")
+            # Keep the most urgent decisions, in priority order, up to the per-cycle cap
+            heap = [(_PRIORITY_RANK.get(d['priority'], len(_PRIORITY_RANK)), i, d) for i, d in enumerate(candidates)]
+            heapq.heapify(heap)
+
+            # Optional cap on decisions per cycle; unlimited unless configured
+            max_decisions = self.config.get('max_decisions_per_cycle')
+            decisions = []
+            while heap and (max_decisions is None or len(decisions) < max_decisions):
+                decisions.append(heapq.heappop(heap)[2])
+
+            self.logger.info("📋 Generated %s strategic decisions", len(decisions))
             return decisions
 
         except Exception as e:
-            self.logger.error(f"Error making strategic decisions: {e}")
+            self.logger.error("Error making strategic decisions: %s", e)
             return []
 
     async def execute_decisions(self, decisions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Execute approved strategic decisions"""
         execution_results = []
 
-        for decision in decisions:
-            try:
-                result = await self.execute_single_decision(decision)
-                execution_results.append(result)
+        # Decisions are independent, so run them concurrently
+        outcomes = await asyncio.gather(
+            *(self.execute_single_decision(decision) for decision in decisions),
+            return_exceptions=True
+        )
 
-            except Exception as e:
-                self.logger.error(f"Error executing decision {decision['type']}: {e}")
+        for decision, result in zip(decisions, outcomes):
+            if isinstance(result, BaseException):
+                self.logger.error("Error executing decision %s: %s", decision['type'], result)
                 execution_results.append({
                     'decision': decision,
                     'status': 'failed',
-                    'error': str(e)
+                    'error': str(result)
                 })
+            else:
+                execution_results.append(result)
 
         return execution_results
 
@@ -525,23 +603,18 @@ class EnhancedElizaAgent:
         decision_type = decision['type']
         action = decision['action']
 
-        self.logger.info(f"🎯 Executing decision: {decision_type} - {action}")
-
-        if decision_type == 'mining_optimization':
-            return await self.execute_mining_optimization(decision)
-        elif decision_type == 'treasury_rebalancing':
-            return await self.execute_treasury_rebalancing(decision)
-        elif decision_type == 'governance_enhancement':
-            return await self.execute_governance_enhancement(decision)
-        elif decision_type == 'ecosystem_improvement':
-            return await self.execute_ecosystem_improvement(decision)
-        else:
+        self.logger.info("🎯 Executing decision: %s - %s", decision_type, action)
+
+        handler_name = self._DECISION_HANDLERS.get(decision_type)
+        if handler_name is None:
             return {
                 'decision': decision,
                 'status': 'skipped',
                 'reason': 'Unknown decision type'
             }
 
+        return await getattr(self, handler_name)(decision)
+
     async def execute_mining_optimization(self, decision: Dict[str, Any]) -> Dict[str, Any]:
         """Execute mining optimization decision"""
         try:
@@ -549,11 +622,12 @@ class EnhancedElizaAgent:
             mining_stats = await self.mining_service.get_comprehensive_stats()
 
             # Log optimization attempt
+            attempted_at = int(time.time())
             self.memory['mining_performance'].append({
                 'type': 'optimization_attempt',
                 'decision': decision,
                 'stats_before': mining_stats,
-                'timestamp': int(time.time())
+                'timestamp': attempted_at
             })
 
             # For now, this is primarily monitoring and alerting
@@ -563,11 +637,11 @@ class EnhancedElizaAgent:
                 'decision': decision,
                 'status': 'completed',
                 'action_taken': 'mining_monitoring_enhanced',
-                'next_review': int(time.time()) + 3600  # Review in 1 hour
+                'next_review': attempted_at + 3600  # Review in 1 hour
             }
 
         except Exception as e:
-            self.logger.error(f"Error executing mining optimization: {e}")
+            self.logger.error("Error executing mining optimization: %s", e)
             return {
                 'decision': decision,
                 'status': 'failed',
@@ -599,7 +673,7 @@ class EnhancedElizaAgent:
             }
 
         except Exception as e:
-            self.logger.error(f"Error executing treasury rebalancing: {e}")
+            self.logger.error("Error executing treasury rebalancing: %s", e)
             return {
                 'decision': decision,
                 'status': 'failed',
@@ -628,7 +702,7 @@ class EnhancedElizaAgent:
             }
 
         except Exception as e:
-            self.logger.error(f"Error executing governance enhancement: {e}")
+            self.logger.error("Error executing governance enhancement: %s", e)
             return {
                 'decision': decision,
                 'status': 'failed',
@@ -655,7 +729,7 @@ class EnhancedElizaAgent:
             }
 
         except Exception as e:
-            self.logger.error(f"Error executing ecosystem improvement: {e}")
+            self.logger.error("Error executing ecosystem improvement: %s", e)
             return {
                 'decision': decision,
                 'status': 'failed',
@@ -668,10 +742,16 @@ class EnhancedElizaAgent:
             successful_decisions = [r for r in execution_results if r.get('status') == 'completed']
             failed_decisions = [r for r in execution_results if r.get('status') == 'failed']
 
-            # Update decision accuracy
+            # Append this cycle's outcomes to the column log
+            recorded_at = int(time.time())
+            for result in execution_results:
+                self._outcome_types.append(result.get('decision', {}).get('type', 'unknown'))
+                self._outcome_succeeded.append(result.get('status') == 'completed')
+                self._outcome_timestamps.append(recorded_at)
+
+            # Update decision accuracy from the full outcome history, favouring recent decisions
             if execution_results:
-                success_rate = len(successful_decisions) / len(execution_results)
-                self.decision_accuracy = (self.decision_accuracy + success_rate) / 2
+                self.decision_accuracy = self._compute_decision_accuracy(recorded_at)
 
             # Store learning outcomes
             learning_outcome = {
@@ -690,10 +770,29 @@ class EnhancedElizaAgent:
             elif self.decision_accuracy < 0.6:
                 self.consciousness_level = max(self.consciousness_level - 0.01, 0.7)
 
-            self.logger.info(f"🧠 Learning complete - Decision accuracy: {self.decision_accuracy:.2f}, Consciousness: {self.consciousness_level:.2f}")
+            self.logger.info("🧠 Learning complete - Decision accuracy: %.2f, Consciousness: %.2f", self.decision_accuracy, self.consciousness_level)
 
         except Exception as e:
-            self.logger.error(f"Error learning from outcomes: {e}")
+            self.logger.error("Error learning from outcomes: %s", e)
+
+    def _compute_decision_accuracy(self, now: int) -> float:
+        """Decay-weighted success rate over the decision outcome log"""
+        half_life = self.config.get('decision_accuracy_half_life', 1800)
+        return _decayed_success_rate(self._outcome_succeeded, self._outcome_timestamps, now, half_life)
+
+    def get_decision_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Get execution counts and success rates per decision type"""
+        attempts = Counter(self._outcome_types)
+        successes = Counter(compress(self._outcome_types, self._outcome_succeeded))
+
+        return {
+            decision_type: {
+                'attempts': count,
+                'successes': successes[decision_type],
+                'success_rate': successes[decision_type] / count
+            }
+            for decision_type, count in attempts.items()
+        }
 
     async def report_cycle_completion(self, cycle_count: int, duration: float, results: List[Dict[str, Any]]):
         """Report autonomous cycle completion"""
@@ -719,10 +818,10 @@ class EnhancedElizaAgent:
                     json.dumps(report)
                 )
 
-            self.logger.info(f"📊 Cycle #{cycle_count} completed in {duration:.1f}s - {successful_actions}/{len(results)} actions successful")
+            self.logger.info("📊 Cycle #%s completed in %.1fs - %s/%s actions successful", cycle_count, duration, successful_actions, len(results))
 
         except Exception as e:
-            self.logger.error(f"Error reporting cycle completion: {e}")
+            self.logger.error("Error reporting cycle completion: %s", e)
 
     async def mining_performance_monitor(self):
         """Continuous mining performance monitoring"""
@@ -738,10 +837,6 @@ class EnhancedElizaAgent:
                     'timestamp': int(time.time())
                 })
 
-                # Keep only recent performance data (last 100 entries)
-                if len(self.memory['mining_performance']) > 100:
-                    self.memory['mining_performance'] = self.memory['mining_performance'][-100:]
-
                 # Check for performance alerts
                 await self.check_mining_alerts(mining_stats)
 
@@ -749,7 +844,7 @@ class EnhancedElizaAgent:
                 await asyncio.sleep(120)  # Monitor every 2 minutes
 
             except Exception as e:
-                self.logger.error(f"Error in mining performance monitoring: {e}")
+                self.logger.error("Error in mining performance monitoring: %s", e)
                 await asyncio.sleep(60)
 
     async def check_mining_alerts(self, mining_stats: Dict[str, Any]):
@@ -760,20 +855,29 @@ class EnhancedElizaAgent:
 
             # Alert thresholds
             if current_hashrate < 1000:  # Below 1 KH/s
-                self.logger.warning(f"⚠️ Mining Alert: Low hashrate {current_hashrate} H/s")
+                self.logger.warning("⚠️ Mining Alert: Low hashrate %s H/s", current_hashrate)
+
+                # React immediately when hashrate first drops instead of waiting for the next tick
+                if not self._low_hashrate_alert:
+                    self.request_cycle('low_hashrate')
+            self._low_hashrate_alert = current_hashrate < 1000
 
             pending_balance = miner_stats.get('pending_balance', 0)
             if pending_balance > 0.1:  # Above 0.1 XMR pending
-                self.logger.info(f"💰 Mining: {pending_balance} XMR pending payout")
+                self.logger.info("💰 Mining: %s XMR pending payout", pending_balance)
 
         except Exception as e:
-            self.logger.error(f"Error checking mining alerts: {e}")
+            self.logger.error("Error checking mining alerts: %s", e)
 
     async def deactivate(self) -> Dict[str, Any]:
         """Deactivate the enhanced Eliza agent"""
         try:
             self.is_active = False
 
+            # Unblock the autonomous cycle waiting for a trigger
+            if self._cycle_triggers is not None:
+                self._cycle_triggers.put_nowait(None)
+
             deactivation_result = {
                 'status': 'deactivated',
                 'final_consciousness_level': self.consciousness_level,
@@ -786,7 +890,7 @@ class EnhancedElizaAgent:
             return deactivation_result
 
         except Exception as e:
-            self.logger.error(f"Error deactivating agent: {e}")
+            self.logger.error("Error deactivating agent: %s", e)
             return {'status': 'error', 'error': str(e)}
 
     async def get_status(self) -> Dict[str, Any]:
@@ -817,5 +921,5 @@ class EnhancedElizaAgent:
             return status
 
         except Exception as e:
-            self.logger.error(f"Error getting agent status: {e}")
+            self.logger.error("Error getting agent status: %s", e)
             return {'error': str(e)}
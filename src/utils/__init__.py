@@ -0,0 +1 @@
+# Shared utilities for XMRT DAO Ecosystem
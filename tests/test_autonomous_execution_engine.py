@@ -0,0 +1,63 @@
+"""
+Tests for the autonomous execution engine
+"""
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agents.autonomous_execution_engine import (
+    AutonomousExecutionEngine,
+    ExecutionPriority,
+    ExecutionTask
+)
+
+
+def _make_task(task_id: str, cpu: int, timeout_seconds: int) -> ExecutionTask:
+    return ExecutionTask(
+        task_id=task_id,
+        task_type='system_command',
+        description=f"Test task {task_id}",
+        priority=ExecutionPriority.MEDIUM,
+        parameters={'resource_requirements': {'cpu': cpu}},
+        dependencies=[],
+        timeout_seconds=timeout_seconds,
+        retry_count=0,
+        max_retries=0
+    )
+
+
+def test_task_expiring_while_waiting_for_resources_does_not_run():
+    async def scenario():
+        engine = AutonomousExecutionEngine({})
+        engine._timeout_watchdog_task = asyncio.ensure_future(engine._timeout_watchdog_loop())
+        executed = []
+
+        async def handler(task):
+            executed.append(task.task_id)
+            if task.task_id == 'holder':
+                await asyncio.sleep(2)
+            return {'success': True, 'task_id': task.task_id}
+
+        engine._execute_task_by_type = handler
+        try:
+            _, waiter_result = await asyncio.gather(
+                engine.execute_task(_make_task('holder', cpu=100, timeout_seconds=10)),
+                engine.execute_task(_make_task('waiter', cpu=50, timeout_seconds=1))
+            )
+        finally:
+            await engine.cleanup()
+        return engine, executed, waiter_result
+
+    engine, executed, waiter_result = asyncio.run(scenario())
+
+    assert waiter_result == {
+        'success': False,
+        'error': 'Task timeout exceeded',
+        'task_id': 'waiter'
+    }
+    assert executed == ['holder']
+    assert engine.resource_pools['cpu'].allocated == 0
+    assert engine._resource_allocations == {}